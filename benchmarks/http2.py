@@ -0,0 +1,142 @@
+"""
+Fan-out benchmark of the HTTP/1.1 (requests) and HTTP/2 (httpx) transports against local stand-in servers that
+answer every request after a fixed latency. Requires httpx[http2].
+
+    python benchmarks/http2.py [--requests 1000] [--concurrency 64] [--latency 0.05]
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import h2.config
+import h2.events
+import h2.connection
+
+# the script directory, not the repository root, is on sys.path when run as python benchmarks/http2.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lunarcrush import LunarCrushV3
+from lunarcrush.transport import HTTP2Transport
+
+_BODY = json.dumps({'data': {'symbol': 'BTC', 'close': 1.0}}).encode()
+
+
+class _HTTP1Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    latency = 0.0
+    connections = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class _HTTP2Protocol(asyncio.Protocol):
+    """
+    Minimal cleartext HTTP/2 (prior knowledge) server answering every stream after ``latency`` seconds.
+    """
+    latency = 0.0
+    connections = 0
+
+    def connection_made(self, transport):
+        type(self).connections += 1
+        self.transport = transport
+        self.conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                asyncio.get_event_loop().create_task(self._respond(event.stream_id))
+        self.transport.write(self.conn.data_to_send())
+
+    async def _respond(self, stream_id):
+        await asyncio.sleep(self.latency)
+        self.conn.send_headers(stream_id, [(':status', '200'), ('content-type', 'application/json'),
+                                           ('content-length', str(len(_BODY)))])
+        self.conn.send_data(stream_id, _BODY, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+def _serve_http1(latency):
+    _HTTP1Handler.latency = latency
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _HTTP1Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_port
+
+
+def _serve_http2(latency):
+    _HTTP2Protocol.latency = latency
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(loop.create_server(_HTTP2Protocol, '127.0.0.1', 0))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return server.sockets[0].getsockname()[1]
+
+
+def _client(port, transport):
+    client = LunarCrushV3('key', transport=transport)
+    client._BASE_URL = f'http://127.0.0.1:{port}'
+    return client
+
+
+def _run_threads(client, requests, concurrency):
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda i: client.get_coin(f'C{i}'), range(requests)))
+
+
+def _run_async(client, requests, concurrency):
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(i):
+            async with semaphore:
+                await client.acall('get_coin', f'C{i}')
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        await client.transport.aclose()
+    asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--latency', type=float, default=0.05, help='Server latency in seconds.')
+    args = parser.parse_args()
+
+    http1_port, http2_port = _serve_http1(args.latency), _serve_http2(args.latency)
+    runs = [
+        ('HTTP/1.1 requests, threads', _HTTP1Handler, lambda: _run_threads(
+            _client(http1_port, 'requests'), args.requests, args.concurrency)),
+        ('HTTP/2 httpx, threads', _HTTP2Protocol, lambda: _run_threads(
+            _client(http2_port, HTTP2Transport(http1=False)), args.requests, args.concurrency)),
+        ('HTTP/2 httpx, asyncio', _HTTP2Protocol, lambda: _run_async(
+            _client(http2_port, HTTP2Transport(http1=False)), args.requests, args.concurrency)),
+    ]
+    for label, server, run in runs:
+        server.connections = 0
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f'{label:<28} {args.requests / elapsed:8.1f} req/s   {server.connections:4d} connections')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Cold-start benchmark: import time of the package, construction time of a client and time to the first response
+of a local stand-in server. Every sample runs in a fresh interpreter.
+
+    python benchmarks/startup.py [--runs 20]
+"""
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+_PROBE = '''
+import time
+start = time.perf_counter()
+import lunarcrush
+imported = time.perf_counter()
+client = lunarcrush.LunarCrushV3('key')
+client._BASE_URL = {base_url!r}
+created = time.perf_counter()
+client.get_coin('BTC')
+responded = time.perf_counter()
+print(imported - start, created - imported, responded - created)
+'''
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({'data': {'symbol': 'BTC'}}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    server = HTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    probe = _PROBE.format(base_url=f'http://127.0.0.1:{server.server_port}')
+
+    samples = []
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True).stdout
+        samples.append([float(value) for value in output.split()])
+    server.shutdown()
+
+    for i, label in enumerate(('import lunarcrush', 'create LunarCrushV3', 'first request')):
+        values = [sample[i] * 1000 for sample in samples]
+        print(f'{label:<20} median {statistics.median(values):8.2f} ms   min {min(values):8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,32 @@
-from lunarcrush.lcv2 import LunarCrush
-from lunarcrush.lcv3 import LunarCrushV3
+import sys
+import importlib
 
-__all__ = ['LunarCrush', 'LunarCrushV3']
+# Submodules are imported on first attribute access (PEP 562) to keep ``import lunarcrush`` cheap
+_LAZY = {
+    'LunarCrush': 'lunarcrush.lcv2',
+    'LunarCrushV3': 'lunarcrush.lcv3',
+    'LunarCrushAuto': 'lunarcrush.facade',
+    'deadline': 'lunarcrush.deadlines',
+    'LunarCrushError': 'lunarcrush.exceptions',
+    'BackendError': 'lunarcrush.exceptions',
+    'DeadlineExceeded': 'lunarcrush.exceptions',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):  # no module __getattr__
+    for _name in __all__:
+        globals()[_name] = __getattr__(_name)
@@ -0,0 +1,5 @@
+import sys
+
+from lunarcrush.cli import main
+
+sys.exit(main())
@@ -0,0 +1,289 @@
+import os
+import json
+import array
+import time
+import zlib
+import bisect
+import datetime
+import fnmatch
+import hashlib
+import threading
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ARCHIVED_ENDPOINTS = ('/coins', '/coins/global', '/coins/*/change')
+
+_ZSTD, _ZLIB = b'z', b'Z'
+
+
+def _canonical(value) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def _query_value(value) -> str:
+    # the form a parameter takes in the query string, so {'desc': False}, {'desc': 0} and {'desc': '0'} match
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, (list, tuple)):
+        return ','.join(map(str, value))
+    if isinstance(value, datetime.datetime):
+        return str(int(time.mktime(value.timetuple())))
+    return str(value)
+
+
+def _keyed(rows):
+    # lists of dicts with unique ids are diffed by id, so reordered rows (e.g. /coins sorted by rank) stay cheap
+    if not rows or not all(isinstance(row, dict) and 'id' in row for row in rows):
+        return None
+    keyed = {str(row['id']): row for row in rows}
+    return keyed if len(keyed) == len(rows) else None
+
+
+def diff(old, new):
+    """
+    Structural patch turning ``old`` into ``new``, or None if they are equal. Patches are dicts tagged by their
+    first key: ``=`` replaces the value, ``{`` patches a dict, ``[`` patches a list by position and ``#`` patches
+    a list of rows by id.
+    """
+    if type(old) is not type(new):
+        return {'=': new}
+    if isinstance(new, dict):
+        changes = {key: sub for key, sub in ((key, diff(old[key], value) if key in old else {'=': value})
+                                                 for key, value in new.items()) if sub is not None}
+        removed = [key for key in old if key not in new]
+        if not changes and not removed:
+            return None
+        return {'{': changes, '-': removed}
+    if isinstance(new, list):
+        old_rows, new_rows = _keyed(old), _keyed(new)
+        if old_rows is not None and new_rows is not None:
+            changes = {key: sub for key, sub in ((key, diff(old_rows[key], row) if key in old_rows else {'=': row})
+                                                     for key, row in new_rows.items()) if sub is not None}
+            order = list(new_rows)
+            if not changes and order == list(old_rows):
+                return None
+            return {'#': changes, 'o': order}
+        changes = {str(i): sub for i, sub in ((i, diff(old[i], value) if i < len(old) else {'=': value})
+                                                  for i, value in enumerate(new)) if sub is not None}
+        if not changes and len(old) == len(new):
+            return None
+        return {'[': changes, 'n': len(new)}
+    return None if old == new else {'=': new}
+
+
+def patch(old, changes):
+    """
+    Apply a patch produced by ``diff``. ``old`` is not modified.
+    """
+    if '=' in changes:
+        return changes['=']
+    if '{' in changes:
+        new = {key: value for key, value in old.items() if key not in changes['-']}
+        for key, sub in changes['{'].items():
+            new[key] = patch(new.get(key), sub)
+        return new
+    if '#' in changes:
+        rows = {str(row['id']): row for row in old}
+        return [patch(rows.get(key), changes['#'][key]) if key in changes['#'] else rows[key] for key in changes['o']]
+    new = old[:changes['n']]
+    for index, sub in sorted(((int(i), sub) for i, sub in changes['['].items())):
+        if index < len(new):
+            new[index] = patch(new[index], sub)
+        else:
+            new.append(patch(None, sub))
+    return new
+
+
+class ResponseArchive:
+    """
+    Append-only archive of API responses. Register it on a client with ``lc.add_sink(archive)`` and every
+    response of a matching endpoint is stored as a snapshot of its (endpoint, params) stream.
+
+    Snapshots are stored content-addressed under ``objects/``, so identical payloads are written once. Every
+    ``keyframe_interval`` snapshots a stream stores a full copy, in between it only stores a structural delta against
+    the previous snapshot. Objects are compressed with zstd when ``zstandard`` is installed, zlib otherwise.
+    Each stream has a time index under ``index/`` used to reconstruct the response at any point in time.
+
+    Streams are keyed by endpoint and parameters in their query string form, so ``False``, ``0`` and ``'0'`` name
+    the same stream. Parameters left to their default are not known to the archive: use ``client.describe`` to get
+    the exact ``(endpoint, params)`` of a call.
+    """
+
+    def __init__(self, root: str, endpoints: tuple = ARCHIVED_ENDPOINTS, keyframe_interval: int = 60,
+                 level: int = 9):
+        """
+        :param str root: Directory of the archive.
+        :param tuple endpoints: Glob patterns of the endpoints to archive, None archives every endpoint.
+        :param int keyframe_interval: Number of snapshots between two full copies. Bounds the number of deltas
+                                      applied to reconstruct a snapshot.
+        :param int level: Compression level.
+        """
+        self.root = root
+        self.endpoints = endpoints
+        self.keyframe_interval = keyframe_interval
+        self.level = level
+        self._compressor = zstandard.ZstdCompressor(level=level) if zstandard else None
+        self._last = {}  # stream -> (timestamp, snapshot hash, snapshot, snapshots since keyframe)
+        self._indexes = {}  # stream -> (timestamps, index entries), loaded by the first read of the stream
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        os.makedirs(os.path.join(root, 'index'), exist_ok=True)
+
+    @staticmethod
+    def stream(endpoint: str, params: dict = None) -> str:
+        """
+        Identifier of the stream of snapshots of ``endpoint`` called with ``params``.
+        """
+        params = {key: _query_value(value) for key, value in (params or {}).items() if value is not None}
+        return hashlib.sha1(_canonical([endpoint, params])).hexdigest()
+
+    def _index_path(self, stream):
+        return os.path.join(self.root, 'index', f'{stream}.ndjson')
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest[2:])
+
+    def _compress(self, data):
+        if self._compressor is not None:
+            return _ZSTD + self._compressor.compress(data)
+        return _ZLIB + zlib.compress(data, self.level)
+
+    @staticmethod
+    def _decompress(blob):
+        if blob[:1] == _ZSTD:
+            if zstandard is None:
+                raise ImportError('Reading this archive requires zstandard: pip install zstandard')
+            return zstandard.ZstdDecompressor().decompress(blob[1:])
+        return zlib.decompress(blob[1:])
+
+    def _put(self, payload) -> str:
+        data = _canonical(payload)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f'{path}.{threading.get_ident()}.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(self._compress(data))
+            os.replace(tmp, path)
+        return digest
+
+    def _get(self, digest):
+        with open(self._object_path(digest), 'rb') as f:
+            return json.loads(self._decompress(f.read()))
+
+    def __call__(self, endpoint: str, params: dict, response):
+        if self.endpoints is None or any(fnmatch.fnmatchcase(endpoint, pattern) for pattern in self.endpoints):
+            self.add(endpoint, params, response)
+
+    def add(self, endpoint: str, params: dict, response, timestamp: float = None):
+        """
+        Archive a snapshot of ``response``.
+
+        :param str endpoint: Endpoint of the response.
+        :param dict params: Parameters the endpoint was called with.
+        :param response: Decoded response.
+        :param float timestamp: Capture time, defaults to now (never before the latest snapshot of the stream).
+        :raises ValueError: if ``timestamp`` is older than the latest snapshot of the stream.
+        """
+        stream = self.stream(endpoint, params)
+        data = _canonical(response)
+        snapshot_hash = hashlib.sha256(data).hexdigest()
+        response = json.loads(data)  # private copy, later deltas are computed against it
+        with self._lock:
+            if stream not in self._last:
+                self._last[stream] = self._load_last(stream, endpoint, params)
+            last_timestamp, last_hash, last, since_keyframe = self._last[stream]
+            if timestamp is None:
+                # taken under the lock, and clamped against clock steps, so concurrent captures stay in order
+                timestamp = max(time.time(), last_timestamp)
+            elif timestamp < last_timestamp:
+                raise ValueError(f'Snapshot at {timestamp} is older than the latest one of its stream '
+                                 f'({last_timestamp}), snapshots must be added in time order')
+
+            if snapshot_hash == last_hash:
+                entry = [timestamp, snapshot_hash, None, 'same']
+            elif last is None or since_keyframe + 1 >= self.keyframe_interval:
+                entry = [timestamp, snapshot_hash, self._put(response), 'full']
+                since_keyframe = -1
+            else:
+                entry = [timestamp, snapshot_hash, self._put(diff(last, response)), 'delta']
+            with open(self._index_path(stream), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self._last[stream] = (timestamp, snapshot_hash, response, since_keyframe + (entry[3] != 'same'))
+            if stream in self._indexes:
+                timestamps, entries = self._indexes[stream]
+                timestamps.append(timestamp)
+                entries.append(entry)
+
+    def _load_last(self, stream, endpoint, params):
+        # the writer only keeps the latest snapshot of a stream, the index is read once to rebuild it
+        entries = self._read_index(stream)
+        if not entries:
+            with open(os.path.join(self.root, 'streams.ndjson'), 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'stream': stream, 'endpoint': endpoint, 'params': params}) + '\n')
+            return float('-inf'), None, None, 0
+        since_keyframe = 0
+        for entry in reversed(entries):
+            if entry[3] == 'full':
+                break
+            since_keyframe += entry[3] == 'delta'
+        return entries[-1][0], entries[-1][1], self._reconstruct(entries, len(entries) - 1), since_keyframe
+
+    def _read_index(self, stream):
+        path = self._index_path(stream)
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _index(self, stream):
+        # reader side: capture times as a flat array to bisect, entries to reconstruct from
+        if stream not in self._indexes:
+            entries = self._read_index(stream)
+            self._indexes[stream] = (array.array('d', (entry[0] for entry in entries)), entries)
+        return self._indexes[stream]
+
+    def _reconstruct(self, entries, position):
+        start = position
+        while entries[start][3] != 'full':
+            start -= 1
+        snapshot = self._get(entries[start][2])
+        for entry in entries[start + 1:position + 1]:
+            if entry[3] == 'delta':
+                snapshot = patch(snapshot, self._get(entry[2]))
+        return snapshot
+
+    def streams(self) -> list:
+        """
+        Every archived stream as ``{'stream', 'endpoint', 'params'}``.
+        """
+        path = os.path.join(self.root, 'streams.ndjson')
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def timestamps(self, endpoint: str, params: dict = None) -> list:
+        """
+        Capture times of the snapshots of a stream.
+        """
+        with self._lock:
+            return self._index(self.stream(endpoint, params))[0].tolist()
+
+    def get(self, endpoint: str, params: dict = None, at: float = None):
+        """
+        Response of ``endpoint`` called with ``params`` as captured at time ``at`` (the latest snapshot taken at or
+        before it), or the latest one if ``at`` is None.
+
+        :raises KeyError: if there is no snapshot at or before ``at``.
+        """
+        with self._lock:
+            timestamps, entries = self._index(self.stream(endpoint, params))
+            position = len(entries) - 1 if at is None else bisect.bisect_right(timestamps, at) - 1
+            if position < 0:
+                raise KeyError(f'No snapshot of {endpoint} {params or {}} at {at}')
+            return self._reconstruct(entries, position)
@@ -1,11 +1,372 @@
+import time
+import logging
+import threading
+import contextlib
+import collections
 from abc import ABC
 
+from lunarcrush import deadlines, projection
+from lunarcrush.keypool import KeyPool
+from lunarcrush.transport import TRANSPORTS
+from lunarcrush.exceptions import LunarCrushError, DeadlineExceeded
+
+_log = logging.getLogger(__name__)
+
+# What a get_* method would request, returned by _request while the call is captured
+_Request = collections.namedtuple('_Request', 'endpoint params fields')
+
+
+class _Attempts:
+    """
+    Retry policy of a single call, shared by the sync and async code paths. Each attempt runs inside
+    ``with attempts as headers:`` (``async with`` on the async path): entering reserves a key of the pool and
+    returns the request headers, leaving releases the key and either marks ``response`` as final or sets the
+    ``pause`` before the next attempt.
+    Exceptions that are not worth retrying propagate.
+    """
+
+    def __init__(self, client, url, headers=None):
+        self.client = client
+        self.url = url
+        self.headers = headers or {}
+        self.deadline = client._deadline()
+        self.attempt = 0
+        self.key_retries = 0
+        self.key = None
+        self.response = None
+        self.pause = None
+
+    @property
+    def final(self) -> bool:
+        return self.pause is None
+
+    def _start(self, key):
+        self.key = key
+        self.response = self.pause = None
+        auth = self.client._auth_headers(self.key.key if self.key is not None else self.client._api_key)
+        return dict(self.headers, **auth)
+
+    def __enter__(self):
+        pool = self.client.key_pool
+        return self._start(pool.acquire(self.deadline) if pool is not None else None)
+
+    async def __aenter__(self):
+        # waits for a key without blocking the event loop
+        import asyncio
+        pool, key = self.client.key_pool, None
+        while pool is not None:
+            key, wait = pool.try_acquire()
+            if key is not None:
+                break
+            if self.deadline is not None and wait >= deadlines.remaining(self.deadline):
+                raise DeadlineExceeded('Deadline exceeded while waiting for an API key')
+            await asyncio.sleep(wait)
+        return self._start(key)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
+
+    def __exit__(self, exc_type, exc, tb):
+        client, pool = self.client, self.client.key_pool
+        transport = client.transport
+        status = self.response.status_code if exc is None else None
+        if self.key is not None:
+            pool.release(self.key, status)
+
+        if exc is not None:
+            if not isinstance(exc, transport.timeout_errors + transport.connection_errors):
+                return False
+            if (isinstance(exc, transport.timeout_errors) and self.deadline is not None
+                    and time.monotonic() >= self.deadline):
+                raise DeadlineExceeded(f'Deadline exceeded while requesting {self.url}') from exc
+            if self.attempt >= client.retries:
+                return False
+        elif (self.key is not None and status in KeyPool.AUTH_STATUSES | KeyPool.QUOTA_STATUSES
+              and self.key_retries < len(pool) - 1):
+            self.key_retries += 1  # rejected by this key: try another one right away
+            self.pause = 0.0
+            return False
+        elif status not in client._RETRY_STATUSES or self.attempt >= client.retries:
+            return False
+
+        self.pause = client.backoff * 2 ** self.attempt
+        if self.deadline is not None and time.monotonic() + self.pause >= self.deadline:
+            raise DeadlineExceeded(f'Deadline exceeded while retrying {self.url}')
+        self.attempt += 1
+        return True
+
 
 class LunarCrushABC(ABC):
     _BASE_URL = ''
+    _RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, api_key=None, timeout: float = None, retries: int = 0, backoff: float = 0.5,
+                 hedge_percentile: float = None, hedge_min_samples: int = 20, transport='requests',
+                 request_timeout: float = 30.0):
+        """
+        :param str api_key: LunarCrush API key. A list of keys or a ``KeyPool`` spreads the requests over several
+                            keys.
+        :param float timeout: Time budget in seconds of every call, retries included. An active
+                              ``lunarcrush.deadline`` block can only make it shorter.
+        :param float request_timeout: Connect and read timeout in seconds of every attempt, so a stalled
+                                      connection fails even without a time budget. None waits forever.
+        :param int retries: Number of retries on connection errors and 429/5XX responses.
+        :param float backoff: Base delay in seconds of the exponential backoff between retries.
+        :param float hedge_percentile: Percentile (0-100) of the observed latency after which a duplicate request is
+                                       fired, the first response wins. Disabled by default.
+        :param int hedge_min_samples: Observed requests needed before hedging kicks in.
+        :param transport: HTTP transport: 'requests' (default), 'http2' (requires ``httpx[http2]``) or a transport
+                          instance such as ``HTTP2Transport(max_connections=2)``. Named transports are created on the
+                          first request.
+        """
+        if isinstance(api_key, (list, tuple)):
+            api_key = KeyPool(api_key)
+        self.key_pool = api_key if isinstance(api_key, KeyPool) else None
+        self._api_key = None if self.key_pool is not None else api_key
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.request_timeout = request_timeout
+        self._latencies = collections.defaultdict(lambda: collections.deque(maxlen=512))  # endpoint template -> s
+        self._lock = threading.Lock()
+        self._hedge_executor = None
+        self._sinks = []
+        if isinstance(transport, str) and transport not in TRANSPORTS:
+            raise ValueError(f'Unknown transport {transport!r}. Options: {", ".join(TRANSPORTS)}')
+        self._transport = transport
+        self._local = threading.local()
+
+    @property
+    def transport(self):
+        """
+        HTTP transport, created on the first request.
+        """
+        if isinstance(self._transport, str):
+            with self._lock:
+                if isinstance(self._transport, str):
+                    self._transport = TRANSPORTS[self._transport]()
+        return self._transport
+
+    @staticmethod
+    def _parse_kwargs(kwargs):
+        raise NotImplementedError('Parse kwargs method not implemented')
+
+    def _gen_url(self, endpoint, **kwargs):
+        raise NotImplementedError('Gen url method not implemented')
+
+    def _endpoint_template(self, endpoint):
+        """
+        Endpoint with its path parameters masked, e.g. ``/coins/*/historical``. Latencies used for hedging are
+        tracked per template.
+        """
+        return endpoint
+
+    def _request(self, endpoint, fields=None, **kwargs):
+        captured = getattr(self._local, 'capture', None)
+        if captured is not None:
+            captured.append(_Request(endpoint, kwargs, fields))
+            if len(captured) > 1 or getattr(self._local, 'depth', 0):
+                # second or inner request, e.g. get_coin_id loading the coin list: abort before it has side effects
+                raise LunarCrushError('Not a single API request')
+            return captured[0]
+        kwargs = self._parse_kwargs(kwargs)
+        url = self._gen_url(endpoint, **kwargs)
+        response = self._send(url, endpoint=self._endpoint_template(endpoint))
+        return self._emit(endpoint, self._sink_params(kwargs, fields), projection.loads(response.content, fields))
+
+    @contextlib.contextmanager
+    def _inner_requests(self):
+        """
+        Mark the requests of the block as issued on behalf of another call, e.g. loading the coin list to resolve
+        a symbol, so that a captured method making them is not mistaken for a single request.
+        """
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
+        try:
+            yield
+        finally:
+            self._local.depth -= 1
+
+    def _capture(self, method, *args, **kwargs):
+        # run a get_* method up to its _request call and return what it would request
+        self._local.capture = captured = []
+        try:
+            request = getattr(self, method)(*args, **kwargs)
+        except Exception as e:
+            if not captured:
+                raise
+            raise LunarCrushError(f'{method} is not a single API request') from e
+        finally:
+            self._local.capture = None
+        if len(captured) != 1 or request is not captured[0]:
+            raise LunarCrushError(f'{method} is not a single API request')
+        return request
+
+    def describe(self, method: str, *args, **kwargs) -> tuple:
+        """
+        ``(endpoint, params)`` of a call to one of the ``get_*`` methods as passed to the sinks, without sending
+        it. Defaults included, e.g. ``archive.get(*lc.describe('get_coins'), at=1672531200)``.
+
+        :param str method: Name of the method.
+        :raises LunarCrushError: if the method does not return a single request, e.g. ``get_coin_id``.
+        """
+        endpoint, params, fields = self._capture(method, *args, **kwargs)
+        return endpoint, self._sink_params(self._parse_kwargs(params), fields)
+
+    async def acall(self, method: str, *args, **kwargs) -> dict:
+        """
+        Call one of the ``get_*`` methods on the async code path of the transport, e.g.
+        ``await lc.acall('get_coin', 'BTC')``. Requires a transport with async support such as 'http2'.
+
+        :param str method: Name of the method.
+        :raises LunarCrushError: if the method does not return a single request, e.g. ``get_coin_id``.
+        """
+        endpoint, params, fields = self._capture(method, *args, **kwargs)
+        params = self._parse_kwargs(params)
+        url = self._gen_url(endpoint, **params)
+        response = await self._asend(url, endpoint=self._endpoint_template(endpoint))
+        return self._emit(endpoint, self._sink_params(params, fields), projection.loads(response.content, fields))
+
+    def _auth_headers(self, api_key):
+        """
+        Headers authenticating a request with ``api_key``.
+        """
+        return {}
+
+    def add_sink(self, sink):
+        """
+        Register a callable receiving ``(endpoint, params, response)`` for every decoded response, e.g. a
+        ``ResponseArchive``.
+        """
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink):
+        self._sinks.remove(sink)
+
+    @staticmethod
+    def _sink_params(params, fields):
+        # projected responses are told apart from full ones, e.g. archived as a stream of their own
+        return params if fields is None else dict(params, fields=','.join(fields))
+
+    def _emit(self, endpoint, params, response):
+        # a failing sink is logged, never turned into a failed API call
+        for sink in self._sinks:
+            try:
+                sink(endpoint, params, response)
+            except Exception:
+                _log.exception('Sink %r failed on %s', sink, endpoint)
+        return response
+
+    def _deadline(self):
+        active = deadlines.current()
+        if self.timeout is None:
+            return active
+        own = time.monotonic() + self.timeout
+        return own if active is None else min(own, active)
+
+    def _attempt_timeout(self, call_deadline):
+        left = deadlines.remaining(call_deadline)
+        if self.request_timeout is None:
+            return left
+        return self.request_timeout if left is None else min(left, self.request_timeout)
+
+    def _hedge_delay(self, endpoint):
+        with self._lock:
+            latencies = self._latencies[endpoint]
+            if self.hedge_percentile is None or len(latencies) < self.hedge_min_samples:
+                return None
+            latencies = sorted(latencies)
+        index = min(int(len(latencies) * self.hedge_percentile / 100), len(latencies) - 1)
+        return latencies[index]
+
+    def _get(self, url, headers, timeout, endpoint):
+        start = time.monotonic()
+        response = self.transport.get(url, headers=headers, timeout=timeout)
+        with self._lock:
+            self._latencies[endpoint].append(time.monotonic() - start)
+        return response
+
+    def _hedge(self, url, headers, timeout, endpoint, key):
+        # the duplicate request runs on a key of its own, counted in that key's quota window. A duplicate the key
+        # was rejected with is dropped (None), the primary request then decides the outcome of the attempt
+        if key is None:
+            return self._get(url, headers, timeout, endpoint)
+        status = None
+        try:
+            response = self._get(url, dict(headers, **self._auth_headers(key.key)), timeout, endpoint)
+            status = response.status_code
+        finally:
+            self.key_pool.release(key, status)
+        return None if status in KeyPool.AUTH_STATUSES | KeyPool.QUOTA_STATUSES else response
+
+    def _hedged_get(self, url, headers, call_deadline, endpoint):
+        delay = self._hedge_delay(endpoint)
+        timeout = self._attempt_timeout(call_deadline)
+        if delay is None:
+            return self._get(url, headers, timeout, endpoint)
+
+        from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=16)
+        pending = {self._hedge_executor.submit(self._get, url, headers, timeout, endpoint)}
+        done, pending = wait(pending, timeout=delay if timeout is None else min(delay, timeout))
+        if not done:
+            key = None
+            if self.key_pool is not None:
+                key, _ = self.key_pool.try_acquire()  # no key free right now: no hedge, the primary is not delayed
+            if key is not None or self.key_pool is None:
+                pending.add(self._hedge_executor.submit(self._hedge, url, headers,
+                                                        self._attempt_timeout(call_deadline), endpoint, key))
+        error = None
+        while pending or done:
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    error = error or e
+                    continue
+                if response is not None:
+                    return response
+            if not pending:
+                break
+            left = deadlines.remaining(call_deadline)
+            done, pending = wait(pending, timeout=left, return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceeded(f'Deadline exceeded while requesting {url}')
+        raise error
+
+    def _send(self, url, headers=None, endpoint=None):
+        """
+        GET ``url`` within the call deadline, retrying transient failures with exponential backoff and hedging
+        slow requests when enabled. With a key pool every attempt is authenticated with the least loaded key, and
+        auth or quota errors are retried right away on another key.
 
-    def __init__(self, api_key=None):
-        self._api_key = api_key
+        :param str endpoint: Endpoint template of ``url``, used to pick the latency window hedging is based on.
+        """
+        attempts = _Attempts(self, url, headers)
+        while True:
+            with attempts as attempt_headers:
+                attempts.response = self._hedged_get(url, attempt_headers, attempts.deadline, endpoint)
+            if attempts.final:
+                return attempts.response
+            if attempts.pause:
+                time.sleep(attempts.pause)
 
-    def _request(self, endpoint, **kwargs):
-        raise NotImplementedError('Request method not implemented')
+    async def _asend(self, url, headers=None, endpoint=None):
+        """
+        Async counterpart of ``_send``: deadline, retries and key pool are honoured, hedging is not.
+        """
+        import asyncio
+        if not hasattr(self.transport, 'aget'):
+            raise LunarCrushError(f'{type(self.transport).__name__} has no async support, use transport=\'http2\'')
+        attempts = _Attempts(self, url, headers)
+        while True:
+            async with attempts as attempt_headers:
+                attempts.response = await self.transport.aget(url, headers=attempt_headers,
+                                                              timeout=self._attempt_timeout(attempts.deadline))
+            if attempts.final:
+                return attempts.response
+            if attempts.pause:
+                await asyncio.sleep(attempts.pause)
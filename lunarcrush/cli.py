@@ -0,0 +1,212 @@
+import os
+import sys
+import json
+import hashlib
+import argparse
+import inspect
+import itertools
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from lunarcrush import deadlines
+from lunarcrush.ratelimit import RateLimiter
+from lunarcrush.writers import WRITERS
+
+
+def _client_class(version):
+    if version == 'v2':
+        from lunarcrush.lcv2 import LunarCrush
+        return LunarCrush
+    from lunarcrush.lcv3 import LunarCrushV3
+    return LunarCrushV3
+
+
+def endpoints(version: str = 'v3') -> dict:
+    """
+    ``get_*`` methods of the client of the given API version, by name.
+    """
+    return {name: method for name, method in inspect.getmembers(_client_class(version), inspect.isfunction)
+            if name.startswith('get_') and name not in ('get_coin_id', 'get_nft_id')}
+
+
+def _value(text):
+    lowered = text.lower()
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    try:
+        return int(text)
+    except ValueError:
+        return text
+
+
+def parse_grid(params: list) -> list:
+    """
+    Expand ``name=value1,value2`` arguments into the cartesian product of their values.
+    """
+    axes = []
+    for param in params:
+        name, sep, values = param.partition('=')
+        if not sep or not name:
+            raise argparse.ArgumentTypeError(f'Invalid parameter {param!r}, expected name=value[,value...]')
+        axes.append([(name, _value(value)) for value in values.split(',')])
+    return [dict(combination) for combination in itertools.product(*axes)]
+
+
+class _Cache:
+    """
+    On-disk cache of responses keyed by endpoint and parameters.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, endpoint, params):
+        key = json.dumps([endpoint, params], sort_keys=True, default=str).encode('utf-8')
+        return os.path.join(self.directory, hashlib.sha1(key).hexdigest() + '.json')
+
+    def get(self, endpoint, params):
+        if not self.directory or not os.path.exists(self._path(endpoint, params)):
+            return None
+        with open(self._path(endpoint, params), encoding='utf-8') as f:
+            return json.load(f)
+
+    def put(self, endpoint, params, response):
+        if self.directory:
+            path = self._path(endpoint, params)
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(response, f)
+            os.replace(path + '.tmp', path)
+
+
+def _rows(params, response):
+    data = response.get('data', response) if isinstance(response, dict) else response
+    rows = data if isinstance(data, list) else [data]
+    return [dict(params, **row) if isinstance(row, dict) else dict(params, value=row) for row in rows]
+
+
+def export(client, endpoint: str, grid: list, writer, workers: int = 8, rate: float = 5.0,
+           cache_dir: str = None, fields: list = None) -> dict:
+    """
+    Call ``endpoint`` once per parameter set of ``grid`` and write every returned row, along with its parameters,
+    to ``writer``. At most ``2 * workers`` responses are held in memory at a time. ``fields`` only keeps these
+    fields of every row. Requests run under the ``lunarcrush.deadline`` active when ``export`` is called.
+
+    :return: Number of requests, cache hits, failures and rows written. Requests whose rows cannot be written
+             count as failures.
+    """
+    method = getattr(client, endpoint)
+    limiter = RateLimiter(rate)
+    cache = _Cache(cache_dir)
+    stats = {'requests': 0, 'cached': 0, 'failed': 0, 'rows': 0}
+
+    def fetch(params):
+        key = dict(params, fields=fields) if fields else params
+        response = cache.get(endpoint, key)
+        if response is not None:
+            return response, True
+        limiter.acquire()
+        response = method(**params, fields=fields) if fields else method(**params)
+        if not isinstance(response, dict) or response.get('error'):
+            raise ValueError(str(response)[:200])
+        cache.put(endpoint, key, response)
+        return response, False
+
+    fetch = deadlines.propagate(fetch)  # workers run under the deadline of the caller, if any
+    queue = list(reversed(grid))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        while queue or pending:
+            while queue and len(pending) < workers * 2:
+                params = queue.pop()
+                pending[executor.submit(fetch, params)] = params
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                params = pending.pop(future)
+                try:
+                    response, cached = future.result()
+                except Exception as e:
+                    stats['failed'] += 1
+                    print(f'{endpoint} {params} failed: {e}', file=sys.stderr)
+                    continue
+                stats['cached' if cached else 'requests'] += 1
+                rows = _rows(params, response)
+                try:
+                    writer.write(rows)
+                except Exception as e:
+                    stats['failed'] += 1
+                    print(f'{endpoint} {params} could not be written: {e}', file=sys.stderr)
+                    continue
+                stats['rows'] += len(rows)
+    return stats
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog='lunarcrush', description='LunarCrush API bulk exporter.',
+        epilog='example: lunarcrush export get_coin_time_series -p coin=BTC,ETH -p interval=1w,1m -o series.parquet')
+    commands = parser.add_subparsers(dest='command')
+
+    listing = commands.add_parser('endpoints', help='List the endpoints that can be exported.')
+    listing.add_argument('--api-version', choices=('v2', 'v3'), default='v3')
+
+    exporter = commands.add_parser('export', help='Export an endpoint over a grid of parameters.')
+    exporter.add_argument('endpoint', help='Client method to call, e.g. get_coin_time_series.')
+    exporter.add_argument('-p', '--param', action='append', default=[], metavar='NAME=V1[,V2...]',
+                          help='Parameter values, the endpoint is called for every combination.')
+    exporter.add_argument('-o', '--output', required=True, help='Output file.')
+    exporter.add_argument('-f', '--format', choices=sorted(WRITERS),
+                          help='Output format, inferred from the output extension by default.')
+    exporter.add_argument('--api-version', choices=('v2', 'v3'), default='v3')
+    exporter.add_argument('--api-key', default=os.environ.get('LUNARCRUSH_API_KEY'),
+                          help='API key, defaults to $LUNARCRUSH_API_KEY. Comma-separated keys are pooled.')
+    exporter.add_argument('--workers', type=int, default=8, help='Concurrent requests.')
+    exporter.add_argument('--rate', type=float, default=5.0, help='Maximum requests per second.')
+    exporter.add_argument('--cache-dir', help='Directory caching responses between runs.')
+    exporter.add_argument('--fields', help='Comma-separated fields to keep, all by default.')
+    exporter.add_argument('--timeout', type=float, help='Time budget in seconds of every request.')
+    exporter.add_argument('--retries', type=int, default=2, help='Retries on connection errors and 429/5XX.')
+    return parser
+
+
+def main(argv: list = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    if args.command == 'endpoints':
+        for name, method in endpoints(args.api_version).items():
+            params = [param for param in inspect.signature(method).parameters if param != 'self']
+            print(f'{name}({", ".join(params)})')
+        return 0
+    if args.command != 'export':
+        parser.print_help()
+        return 2
+
+    if args.endpoint not in endpoints(args.api_version):
+        parser.error(f'Unknown endpoint {args.endpoint!r}, see `lunarcrush endpoints`')
+    fmt = args.format or os.path.splitext(args.output)[1].lstrip('.')
+    if fmt not in WRITERS:
+        parser.error(f'Cannot infer the output format of {args.output!r}, use --format')
+    if args.api_version == 'v3' and not args.api_key:
+        parser.error('An API key is required for API v3: use --api-key or $LUNARCRUSH_API_KEY')
+    try:
+        grid = parse_grid(args.param)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    api_key = args.api_key.split(',') if args.api_key and ',' in args.api_key else args.api_key
+    try:
+        client = _client_class(args.api_version)(api_key, timeout=args.timeout, retries=args.retries)
+    except ValueError as e:
+        parser.error(str(e))
+    writer = WRITERS[fmt](args.output, append=False)
+    try:
+        stats = export(client, args.endpoint, grid, writer, workers=args.workers, rate=args.rate,
+                       cache_dir=args.cache_dir, fields=args.fields.split(',') if args.fields else None)
+    finally:
+        try:
+            writer.close()
+        except Exception as e:
+            parser.exit(1, f'{parser.prog}: error: could not finish writing {args.output}: {e}\n')
+    print(json.dumps(stats), file=sys.stderr)
+    return 1 if stats['failed'] else 0
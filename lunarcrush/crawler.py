@@ -0,0 +1,193 @@
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from lunarcrush import deadlines
+from lunarcrush.ratelimit import RateLimiter
+from lunarcrush.writers import open_writer
+
+
+class CrawlStats:
+    """
+    Progress and throughput of a crawl.
+    """
+
+    def __init__(self, total: int = 0, skipped: int = 0):
+        self.total = total
+        self.skipped = skipped
+        self.done = 0
+        self.failed = 0
+        self.errors = []  # {'nft', 'task', 'error'} of every failed task
+        self.rows = 0
+        self.started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def rate(self) -> float:
+        """
+        Completed tasks per second.
+        """
+        return (self.done + self.failed) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def completion(self) -> float:
+        """
+        Fraction of the tasks completed, checkpointed tasks from previous runs included.
+        """
+        return (self.done + self.skipped) / self.total if self.total else 1.0
+
+    @property
+    def eta(self) -> float:
+        """
+        Estimated seconds until the crawl finishes.
+        """
+        left = self.total - self.skipped - self.done - self.failed
+        return left / self.rate if self.rate else None
+
+    def as_dict(self) -> dict:
+        return {'total': self.total, 'skipped': self.skipped, 'done': self.done, 'failed': self.failed,
+                'rows': self.rows, 'elapsed': self.elapsed, 'rate': self.rate, 'completion': self.completion,
+                'eta': self.eta}
+
+
+def _rows(nft, data):
+    rows = data if isinstance(data, list) else [data]
+    return [dict(row, nft_id=nft) if isinstance(row, dict) else {'nft_id': nft, 'value': row} for row in rows]
+
+
+class NFTCrawler:
+    """
+    Crawl every NFT collection with ``get_nft``, ``get_nft_tokens`` and ``get_nft_time_series`` on a bounded worker
+    pool. Each (collection, endpoint) pair is a task; completed tasks are checkpointed so an interrupted crawl
+    resumes where it stopped. Rows are streamed to one file per endpoint inside ``out_dir``. Failed tasks are not
+    checkpointed, so the next run retries them, and are logged with their error to ``failed.ndjson``.
+    """
+    TASKS = ('nft', 'nft_tokens', 'nft_time_series')
+
+    def __init__(self, client, out_dir: str, workers: int = 8, rate: float = 5.0, fmt: str = 'ndjson',
+                 tasks: tuple = TASKS, tokens_limit: int = 100, interval: str = '1w', bucket: str = 'hour',
+                 on_progress=None):
+        """
+        :param LunarCrushV3 client: Client used to issue the requests.
+        :param str out_dir: Directory receiving the output files and the checkpoint.
+        :param int workers: Number of concurrent requests.
+        :param float rate: Maximum number of requests per second.
+        :param str fmt: Output format. Options: 'ndjson', 'csv', 'parquet'.
+        :param tuple tasks: Endpoints to crawl for each collection. Options: 'nft', 'nft_tokens', 'nft_time_series'.
+        :param int tokens_limit: ``limit`` passed to ``get_nft_tokens``.
+        :param str interval: ``interval`` passed to ``get_nft_time_series``.
+        :param str bucket: ``bucket`` passed to ``get_nft_time_series``.
+        :param on_progress: Optional callable receiving the ``CrawlStats`` after every completed task.
+        """
+        unknown = set(tasks) - set(self.TASKS)
+        if unknown:
+            raise ValueError(f'Unknown tasks {sorted(unknown)}. Options: {", ".join(self.TASKS)}')
+        self.client = client
+        self.out_dir = out_dir
+        self.workers = workers
+        self.limiter = RateLimiter(rate)
+        self.fmt = fmt
+        self.tasks = tasks
+        self.tokens_limit = tokens_limit
+        self.interval = interval
+        self.bucket = bucket
+        self.on_progress = on_progress
+        self.checkpoint_path = os.path.join(out_dir, 'checkpoint.ndjson')
+        self.failed_path = os.path.join(out_dir, 'failed.ndjson')
+        self.stats = CrawlStats()
+
+    def collections(self) -> list:
+        """
+        Ids of every NFT collection tracked by LunarCrush.
+        """
+        return [nft.get('id') for nft in self.client.get_nfts_list()['data']]
+
+    def _completed(self) -> set:
+        if not os.path.exists(self.checkpoint_path):
+            return set()
+        with open(self.checkpoint_path, encoding='utf-8') as f:
+            return {tuple(json.loads(line)) for line in f if line.strip()}
+
+    def _fetch(self, nft, task):
+        self.limiter.acquire()
+        if task == 'nft':
+            response = self.client.get_nft(nft)
+        elif task == 'nft_tokens':
+            response = self.client.get_nft_tokens(nft, limit=self.tokens_limit)
+        else:
+            response = self.client.get_nft_time_series(nft, interval=self.interval, bucket=self.bucket)
+        if not isinstance(response, dict) or 'data' not in response:
+            raise ValueError(f'Unexpected response for {task} {nft}: {str(response)[:200]}')
+        return _rows(nft, response['data'])
+
+    def run(self, nfts: list = None) -> CrawlStats:
+        """
+        Crawl ``nfts`` (every collection by default) and return the crawl statistics.
+
+        :param list nfts: Ids of the collections to crawl.
+        """
+        os.makedirs(self.out_dir, exist_ok=True)
+        nfts = self.collections() if nfts is None else nfts
+        completed = self._completed()
+        queue = [(nft, task) for nft in nfts for task in self.tasks if (nft, task) not in completed]
+        self.stats = CrawlStats(total=len(nfts) * len(self.tasks), skipped=len(nfts) * len(self.tasks) - len(queue))
+
+        fetch = deadlines.propagate(self._fetch)  # workers run under the deadline of the caller, if any
+        writers = {task: open_writer(self.out_dir, task, self.fmt) for task in self.tasks}
+        unflushed = {task: [] for task in self.tasks}
+        queue.reverse()
+        with open(self.checkpoint_path, 'a', encoding='utf-8') as checkpoint, \
+                open(self.failed_path, 'a', encoding='utf-8') as failures:
+            def fail(nft, task, error):
+                error = {'nft': nft, 'task': task, 'error': f'{type(error).__name__}: {error}'}
+                self.stats.failed += 1
+                self.stats.errors.append(error)
+                failures.write(json.dumps(dict(error, time=time.time())) + '\n')
+                failures.flush()
+
+            def commit(task):
+                # only checkpoint tasks whose rows reached the disk
+                checkpoint.writelines(json.dumps(key) + '\n' for key in unflushed[task])
+                checkpoint.flush()
+                unflushed[task] = []
+
+            try:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    pending = {}
+                    while queue or pending:
+                        while queue and len(pending) < self.workers * 2:
+                            nft, task = queue.pop()
+                            pending[executor.submit(fetch, nft, task)] = (nft, task)
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            nft, task = pending.pop(future)
+                            try:
+                                rows = future.result()
+                                writers[task].write(rows)
+                            except Exception as e:
+                                fail(nft, task, e)
+                            else:
+                                unflushed[task].append([nft, task])
+                                if not writers[task].buffered:
+                                    commit(task)
+                                self.stats.done += 1
+                                self.stats.rows += len(rows)
+                            if self.on_progress:
+                                self.on_progress(self.stats)
+            finally:
+                # close every writer even if one fails, the others would be left without a footer
+                error = None
+                for task, writer in writers.items():
+                    try:
+                        writer.close()
+                    except Exception as e:
+                        error = error or e
+                    else:
+                        commit(task)
+                if error is not None:
+                    raise error
+        return self.stats
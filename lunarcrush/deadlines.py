@@ -0,0 +1,65 @@
+import time
+import contextlib
+import functools
+import contextvars
+
+from lunarcrush.exceptions import DeadlineExceeded
+
+# a context variable rather than a thread-local, so concurrent asyncio tasks each see their own deadline
+_deadline = contextvars.ContextVar('lunarcrush_deadline', default=None)
+
+
+def current() -> float:
+    """
+    Monotonic timestamp of the innermost active deadline, or None if there is none.
+    """
+    return _deadline.get()
+
+
+def remaining(deadline: float = None) -> float:
+    """
+    Seconds left until ``deadline`` (the active one by default), or None if there is no deadline.
+
+    :raises DeadlineExceeded: if the deadline has already passed.
+    """
+    deadline = current() if deadline is None else deadline
+    if deadline is None:
+        return None
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded('Deadline exceeded')
+    return left
+
+
+@contextlib.contextmanager
+def deadline(seconds: float):
+    """
+    Bound every request issued inside the block by a shared time budget. Nested deadlines can only shrink the
+    budget, so a composite call never outlives the deadline of its caller.
+
+    :param float seconds: Time budget of the block.
+    """
+    previous = current()
+    new = time.monotonic() + seconds
+    token = _deadline.set(new if previous is None else min(new, previous))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def propagate(fn):
+    """
+    Wrap ``fn`` so that it runs under the deadline active at wrapping time. Use it when handing work to other
+    threads, which do not inherit the caller's context. Tasks created with asyncio inherit it already.
+    """
+    captured = current()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = _deadline.set(captured)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _deadline.reset(token)
+    return wrapper
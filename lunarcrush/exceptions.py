@@ -0,0 +1,18 @@
+class LunarCrushError(Exception):
+    """Base exception raised by the LunarCrush wrappers."""
+
+
+class BackendError(LunarCrushError):
+    """A backend answered with an error payload or a response that could not be decoded."""
+
+
+class DeadlineExceeded(LunarCrushError, TimeoutError):
+    """The time budget of a call ran out before a response was received."""
+
+
+class NoKeyAvailable(LunarCrushError):
+    """Every API key of a key pool is quarantined."""
+
+
+class SchemaError(LunarCrushError):
+    """A field of a response does not have the expected type."""
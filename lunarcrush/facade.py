@@ -0,0 +1,361 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from lunarcrush.lcv2 import LunarCrush
+from lunarcrush.lcv3 import LunarCrushV3
+from lunarcrush import deadlines
+from lunarcrush.exceptions import LunarCrushError, BackendError, DeadlineExceeded
+
+# Number of days covered by each v3 interval, used to size v2 ``data_points``.
+_INTERVAL_DAYS = {'1d': 1, '1w': 7, '1m': 30, '3m': 90, '6m': 180, '1y': 365, '2y': 730}
+_V2_MAX_DATA_POINTS = 720
+
+
+class BackendHealth:
+    """
+    Exponentially weighted latency and error rate of a single API backend, with a circuit breaker: a backend whose
+    error rate reaches ``max_error_rate`` ranks after every healthy one until ``cooldown`` seconds pass without
+    errors.
+    """
+
+    def __init__(self, alpha: float = 0.2, error_penalty: float = 1.0, max_error_rate: float = 0.5,
+                 cooldown: float = 30.0):
+        """
+        :param float alpha: Weight of the latest observation in the moving averages.
+        :param float error_penalty: Seconds added to the score per unit of error rate, the cost of a failed call
+                                    that has to fall back to the other backend.
+        :param float max_error_rate: Error rate opening the circuit breaker.
+        :param float cooldown: Seconds without errors after which an open breaker lets the backend be ranked again.
+        """
+        self.alpha = alpha
+        self.error_penalty = error_penalty
+        self.max_error_rate = max_error_rate
+        self.cooldown = cooldown
+        self.latency = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.last_error = None
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, error: bool = False):
+        with self._lock:
+            self.calls += 1
+            self.errors += error
+            if error:
+                self.last_error = time.monotonic()
+            if self.latency is None:
+                self.latency, self.error_rate = elapsed, float(error)
+            else:
+                self.latency += self.alpha * (elapsed - self.latency)
+                self.error_rate += self.alpha * (float(error) - self.error_rate)
+
+    @property
+    def tripped(self) -> bool:
+        """
+        Whether the circuit breaker is open.
+        """
+        return (self.error_rate >= self.max_error_rate and self.last_error is not None
+                and time.monotonic() - self.last_error < self.cooldown)
+
+    def score(self) -> float:
+        """
+        Expected cost of sending a request to this backend, the lower the better: its latency plus the error
+        penalty, or infinity while the circuit breaker is open. Backends without observations score 0 so they get
+        probed before being ranked against the others.
+        """
+        if self.latency is None:
+            return 0.0
+        if self.tripped:
+            return float('inf')
+        return self.latency + self.error_rate * self.error_penalty
+
+    def as_dict(self) -> dict:
+        return {'latency': self.latency, 'error_rate': self.error_rate, 'calls': self.calls, 'errors': self.errors,
+                'tripped': self.tripped}
+
+
+def _data(response):
+    if not isinstance(response, dict) or response.get('error') or 'data' not in response:
+        raise BackendError(f'Unexpected response: {str(response)[:200]}')
+    return response['data']
+
+
+def _first(data):
+    if isinstance(data, list):
+        if not data:
+            raise BackendError('Empty response')
+        return data[0]
+    return data
+
+
+# Common field -> fields it is read from, the first one present is used. Both versions share most names, the
+# alternatives cover the fields that were renamed between them.
+_COIN_FIELDS = {
+    'id': ('id',),
+    'symbol': ('symbol',),
+    'name': ('name',),
+    'price': ('price', 'close'),
+    'price_btc': ('price_btc',),
+    'market_cap': ('market_cap',),
+    'volume_24h': ('volume_24h', 'volume'),
+    'percent_change_24h': ('percent_change_24h',),
+    'galaxy_score': ('galaxy_score',),
+    'alt_rank': ('alt_rank',),
+}
+_TIME_SERIES_FIELDS = {
+    'time': ('time',),
+    'open': ('open',),
+    'high': ('high',),
+    'low': ('low',),
+    'close': ('close',),
+    'volume': ('volume', 'volume_24h'),
+    'market_cap': ('market_cap',),
+    'galaxy_score': ('galaxy_score',),
+    'alt_rank': ('alt_rank',),
+}
+_INFLUENCER_FIELDS = {
+    'id': ('id', 'twitter_id'),
+    'screen_name': ('twitter_screen_name', 'screen_name', 'username'),
+    'display_name': ('display_name', 'name'),
+    'followers': ('followers', 'followers_count', 'follower_count'),
+    'engagement': ('engagement', 'engagements'),
+    'volume': ('volume', 'posts'),
+}
+_FEED_FIELDS = {
+    'id': ('id',),
+    'type': ('type',),
+    'title': ('title',),
+    'body': ('body', 'text', 'description'),
+    'url': ('url', 'post_link'),
+    'time': ('time', 'post_created'),
+}
+_EXCHANGE_FIELDS = {
+    'id': ('id',),
+    'name': ('name',),
+    'volume_24h': ('volume_24h', '1d_volume', 'volume'),
+    'trades_24h': ('trades_24h', '1d_trades'),
+    'num_pairs': ('num_pairs', 'pairs'),
+}
+_COIN_OF_THE_DAY_FIELDS = {
+    'id': ('id',),
+    'symbol': ('symbol',),
+    'name': ('name',),
+}
+
+
+def _map_fields(row, fields):
+    if not isinstance(row, dict):
+        raise BackendError(f'Unexpected row: {str(row)[:200]}')
+    return {field: next((row[key] for key in candidates if row.get(key) is not None), None)
+            for field, candidates in fields.items()}
+
+
+def _rows(fields):
+    def normalize(data):
+        return [_map_fields(row, fields) for row in (data if isinstance(data, list) else [data])]
+    return normalize
+
+
+def _one(fields):
+    return lambda data: _map_fields(_first(data), fields)
+
+
+def _time_series(data):
+    if isinstance(data, list) and data and isinstance(data[0], dict) and 'timeSeries' in data[0]:
+        data = data[0]
+    if isinstance(data, dict):
+        data = data.get('timeSeries') or data.get('time_series') or []
+    return [_map_fields(point, _TIME_SERIES_FIELDS) for point in data]
+
+
+def _enveloped(response):
+    # v3 /coinoftheday answers with the coin itself rather than a {'data': ...} envelope
+    if isinstance(response, dict) and 'data' not in response and not response.get('error'):
+        return {'data': response}
+    return response
+
+
+def _v2_data_points(interval, bucket):
+    days = _INTERVAL_DAYS.get(interval, _V2_MAX_DATA_POINTS)
+    return min(days * 24 if bucket == 'hour' else days, _V2_MAX_DATA_POINTS)
+
+
+# Logical operation -> {version: (call, normalize)}. Every payload is mapped onto a common schema, so callers never
+# have to branch on the source of a response.
+_OPERATIONS = {
+    'coin': {
+        'v2': (lambda lc, coin: lc.get_assets(symbol=[coin], data_points=0), _one(_COIN_FIELDS)),
+        'v3': (lambda lc, coin: lc.get_coin(coin), _one(_COIN_FIELDS)),
+    },
+    'coin_time_series': {
+        'v2': (lambda lc, coin, interval, bucket: lc.get_assets(symbol=[coin], interval=bucket,
+                                                                data_points=_v2_data_points(interval, bucket)),
+               _time_series),
+        'v3': (lambda lc, coin, interval, bucket: lc.get_coin_time_series(coin, interval=interval, bucket=bucket),
+               _time_series),
+    },
+    'influencers': {
+        'v2': (lambda lc, coin, limit: lc.get_influencers(symbol=[coin]), _rows(_INFLUENCER_FIELDS)),
+        'v3': (lambda lc, coin, limit: lc.get_coin_influencers(coin, limit=limit), _rows(_INFLUENCER_FIELDS)),
+    },
+    'feeds': {
+        'v2': (lambda lc, coin, limit: lc.get_feeds(symbol=[coin], limit=limit), _rows(_FEED_FIELDS)),
+        'v3': (lambda lc, coin, limit: lc.get_feeds(limit=limit, symbol=coin), _rows(_FEED_FIELDS)),
+    },
+    'exchanges': {
+        'v2': (lambda lc, limit: lc.get_exchanges(limit=limit), _rows(_EXCHANGE_FIELDS)),
+        'v3': (lambda lc, limit: lc.get_exchanges(limit=limit), _rows(_EXCHANGE_FIELDS)),
+    },
+    'coin_of_the_day': {
+        'v2': (lambda lc: lc.get_coin_of_the_day(), _one(_COIN_OF_THE_DAY_FIELDS)),
+        'v3': (lambda lc: _enveloped(lc.get_coin_of_the_day()), _one(_COIN_OF_THE_DAY_FIELDS)),
+    },
+}
+
+
+class LunarCrushAuto:
+    """
+    Facade over LunarCrush API v2 and v3. Each logical operation is mapped onto both versions, routed to the
+    backend with the lowest observed latency and error rate, and hedged against the other backend when the first
+    one does not answer within ``hedge_after`` seconds. Errors on one backend fall back to the other.
+
+    Every method returns ``{'source': 'v2' | 'v3', 'data': ...}`` where ``data`` follows the same schema whichever
+    backend answered. Fields a backend does not provide are None.
+    """
+
+    def __init__(self, api_key: str = None, v2: LunarCrush = None, v3: LunarCrushV3 = None,
+                 hedge_after: float = 1.0, prefer: tuple = ('v3', 'v2'), max_workers: int = 8):
+        """
+        :param str api_key: LunarCrush API v3 key, used to build the v3 client when ``v3`` is not provided.
+        :param LunarCrush v2: Optional v2 client. A keyless one is created by default.
+        :param LunarCrushV3 v3: Optional v3 client.
+        :param float hedge_after: Seconds to wait for the primary backend before racing the other one.
+                                  None disables hedging (the other backend is still used as a fallback).
+        :param tuple prefer: Backend order used to break ties between equally healthy backends.
+        :param int max_workers: Size of the thread pool running backend calls.
+        """
+        self.backends = {'v2': v2 or LunarCrush()}
+        if v3 is not None or api_key is not None:
+            self.backends['v3'] = v3 or LunarCrushV3(api_key)
+        self.health = {version: BackendHealth() for version in self.backends}
+        self.hedge_after = hedge_after
+        self.prefer = prefer
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _rank(self, operation):
+        versions = [version for version in self.prefer
+                    if version in self.backends and version in _OPERATIONS[operation]]
+        return sorted(versions, key=lambda version: self.health[version].score())
+
+    def _timed_call(self, version, operation, args):
+        call, normalize = _OPERATIONS[operation][version]
+        start = time.perf_counter()
+        try:
+            data = _data(call(self.backends[version], *args))
+            data = normalize(data)
+        except Exception:
+            self.health[version].record(time.perf_counter() - start, error=True)
+            raise
+        self.health[version].record(time.perf_counter() - start)
+        return {'source': version, 'data': data}
+
+    def _submit(self, version, operation, args):
+        return self._executor.submit(deadlines.propagate(self._timed_call), version, operation, args)
+
+    def _call(self, operation, *args):
+        candidates = self._rank(operation)
+        if not candidates:
+            raise LunarCrushError(f'No backend available for {operation!r}')
+
+        pending = {self._submit(candidates.pop(0), operation, args)}
+        last_error = None
+        while pending:
+            left = deadlines.remaining()
+            timeout = self.hedge_after if candidates else None
+            if left is not None:
+                timeout = left if timeout is None else min(timeout, left)
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if not candidates or deadlines.current() is not None and time.monotonic() >= deadlines.current():
+                    raise DeadlineExceeded(f'Deadline exceeded while calling {operation!r}')
+                # primary is slow: hedge on the next backend
+                pending.add(self._submit(candidates.pop(0), operation, args))
+                continue
+            for future in done:
+                try:
+                    return future.result()
+                except Exception as e:
+                    last_error = e
+            if candidates and not pending:  # every in-flight call failed: fall back
+                pending.add(self._submit(candidates.pop(0), operation, args))
+        raise last_error
+
+    def stats(self) -> dict:
+        """
+        Current latency and error rate tracked for each backend.
+        """
+        return {version: health.as_dict() for version, health in self.health.items()}
+
+    def get_coin(self, coin: str) -> dict:
+        """
+        Snapshot of the current metrics of a coin.
+
+        :param str coin: Symbol of the coin.
+        """
+        return self._call('coin', coin)
+
+    def get_coin_time_series(self, coin: str, interval: str = '1w', bucket: str = 'hour') -> dict:
+        """
+        Time series of metrics of a coin as a list of data points.
+
+        :param str coin: Symbol of the coin.
+        :param str interval: The time interval to use. Options: '1d', '1w', '1m', '3m', '6m', '1y', '2y'.
+        :param str bucket: Use hour or day time buckets. Options: 'hour', 'day'.
+        """
+        return self._call('coin_time_series', coin, interval, bucket)
+
+    def get_influencers(self, coin: str, limit: int = 100) -> dict:
+        """
+        Social accounts with the most influence on a coin, as a list of ``id``, ``screen_name``, ``display_name``,
+        ``followers``, ``engagement`` and ``volume``.
+
+        :param str coin: Symbol of the coin.
+        :param int limit: Limit the number of results (v3 only).
+        """
+        return self._call('influencers', coin, limit)
+
+    def get_feeds(self, coin: str, limit: int = 10) -> dict:
+        """
+        Social posts, news, and shared links for a coin, as a list of ``id``, ``type``, ``title``, ``body``, ``url``
+        and ``time``.
+
+        :param str coin: Symbol of the coin.
+        :param int limit: Limit the number of results.
+        """
+        return self._call('feeds', coin, limit)
+
+    def get_exchanges(self, limit: int = 10) -> dict:
+        """
+        Exchanges tracked by LunarCrush, as a list of ``id``, ``name``, ``volume_24h``, ``trades_24h`` and
+        ``num_pairs``.
+
+        :param int limit: Limit the number of results.
+        """
+        return self._call('exchanges', limit)
+
+    def get_coin_of_the_day(self) -> dict:
+        """
+        The current coin of the day, as its ``id``, ``symbol`` and ``name``.
+        """
+        return self._call('coin_of_the_day')
@@ -0,0 +1,164 @@
+import time
+import threading
+import collections
+
+from lunarcrush import deadlines
+from lunarcrush.exceptions import NoKeyAvailable, DeadlineExceeded
+
+
+class APIKey:
+    """
+    An API key of a ``KeyPool`` with its quota, weight and usage.
+    """
+
+    def __init__(self, key: str, quota: int = None, weight: float = 1.0):
+        self.key = key
+        self.quota = quota
+        self.weight = weight
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.quarantined_until = 0.0
+        self.quarantine_reason = None  # 'auth' or 'quota'
+        self.quota_strikes = 0  # consecutive quota errors, doubling the quarantine
+        self.window = collections.deque()
+
+    def __repr__(self):
+        return f'APIKey({self.key[:4]}..., quota={self.quota}, weight={self.weight})'
+
+
+class KeyPool:
+    """
+    Pool of API keys. Every request goes to the available key with the lowest load relative to its weight, the
+    load being its in-flight requests plus the requests it sent in the current window, so concurrent calls go to
+    the least busy key and serial calls are spread in weighted round robin. Keys over their quota are skipped until
+    their window frees up. Keys answering with a quota error are quarantined for a cooldown doubling on every
+    consecutive error, keys answering with an auth error for ``auth_cooldown``.
+    """
+    AUTH_STATUSES = frozenset({401, 403})
+    QUOTA_STATUSES = frozenset({429})
+
+    def __init__(self, keys, quotas: list = None, weights: list = None, window: float = 60.0,
+                 quota_cooldown: float = 1.0, max_quota_cooldown: float = 60.0, auth_cooldown: float = 3600.0):
+        """
+        :param list keys: API keys, or ``APIKey`` instances.
+        :param list quotas: Maximum number of requests of each key per ``window``. None means unlimited.
+        :param list weights: Share of the traffic of each key. Defaults to 1 for every key.
+        :param float window: Length in seconds of the quota window.
+        :param float quota_cooldown: Seconds a key is quarantined after a 429 response, doubled on every
+                                     consecutive 429.
+        :param float max_quota_cooldown: Upper bound of the quota quarantine.
+        :param float auth_cooldown: Seconds a key is quarantined after a 401/403 response.
+        :raises ValueError: if ``quotas`` or ``weights`` do not have one value per key, or a weight is not positive.
+        """
+        keys = list(keys)
+        if not keys:
+            raise ValueError('A KeyPool needs at least one key')
+        quotas = [None] * len(keys) if quotas is None else list(quotas)
+        weights = [1.0] * len(keys) if weights is None else list(weights)
+        if len(quotas) != len(keys) or len(weights) != len(keys):
+            raise ValueError(f'Expected one quota and one weight per key ({len(keys)}), got {len(quotas)} quotas '
+                             f'and {len(weights)} weights')
+        self.keys = [key if isinstance(key, APIKey) else APIKey(key, quota, weight)
+                     for key, quota, weight in zip(keys, quotas, weights)]
+        if any(key.weight <= 0 for key in self.keys):
+            raise ValueError('Key weights must be positive')
+        self.window = window
+        self.quota_cooldown = quota_cooldown
+        self.max_quota_cooldown = max_quota_cooldown
+        self.auth_cooldown = auth_cooldown
+        self._condition = threading.Condition()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _available_at(self, key, now):
+        """
+        Time at which ``key`` can take a new request.
+        """
+        while key.window and key.window[0] <= now - self.window:
+            key.window.popleft()
+        available = key.quarantined_until
+        if key.quota is not None and len(key.window) >= key.quota:
+            available = max(available, key.window[len(key.window) - key.quota] + self.window)
+        return available
+
+    def _try_acquire(self, now):
+        ready = [key for key in self.keys if self._available_at(key, now) <= now]
+        if ready:
+            key = min(ready, key=lambda k: ((k.in_flight + len(k.window) + 1) / k.weight, k.requests / k.weight))
+            key.in_flight += 1
+            key.requests += 1
+            key.window.append(now)
+            return key, 0.0
+        if all(key.quarantine_reason == 'auth' and key.quarantined_until > now for key in self.keys):
+            raise NoKeyAvailable('Every API key of the pool was rejected (401/403)')
+        return None, min(self._available_at(key, now) for key in self.keys) - now
+
+    def try_acquire(self) -> tuple:
+        """
+        Reserve a key for a request if one is available right now, without waiting. A reserved key must be paired
+        with ``release``.
+
+        :return: ``(key, 0.0)``, or ``(None, wait)`` with the seconds until a key may become available.
+        :raises NoKeyAvailable: if every key is quarantined after an auth error.
+        """
+        with self._condition:
+            return self._try_acquire(time.monotonic())
+
+    def acquire(self, call_deadline: float = None) -> APIKey:
+        """
+        Reserve a key for a request, waiting for a quota window or a quota quarantine to end if needed. Must be
+        paired with ``release``.
+
+        :param float call_deadline: Monotonic time after which waiting raises ``DeadlineExceeded``.
+        :raises NoKeyAvailable: if every key is quarantined after an auth error.
+        """
+        with self._condition:
+            while True:
+                key, wait = self._try_acquire(time.monotonic())
+                if key is not None:
+                    return key
+                if call_deadline is not None:
+                    left = deadlines.remaining(call_deadline)
+                    if wait >= left:
+                        raise DeadlineExceeded('Deadline exceeded while waiting for an API key')
+                self._condition.wait(wait)
+
+    def release(self, key: APIKey, status: int = None):
+        """
+        Return a key acquired with ``acquire`` along with the HTTP status of its response (None on network errors).
+        """
+        with self._condition:
+            key.in_flight -= 1
+            if status in self.AUTH_STATUSES:
+                key.errors += 1
+                key.quarantined_until = time.monotonic() + self.auth_cooldown
+                key.quarantine_reason = 'auth'
+            elif status in self.QUOTA_STATUSES:
+                key.errors += 1
+                cooldown = min(self.quota_cooldown * 2 ** key.quota_strikes, self.max_quota_cooldown)
+                key.quota_strikes += 1
+                key.quarantined_until = time.monotonic() + cooldown
+                key.quarantine_reason = 'quota'
+            elif status is not None:
+                key.quota_strikes = 0
+            self._condition.notify()
+
+    def utilization(self) -> list:
+        """
+        Usage of every key: in-flight and total requests, errors, requests in the current quota window and
+        quarantine status.
+        """
+        with self._condition:
+            now = time.monotonic()
+            usage = []
+            for key in self.keys:
+                self._available_at(key, now)  # drops requests that left the quota window
+                usage.append({'key': key.key[:4] + '...', 'weight': key.weight, 'quota': key.quota,
+                              'in_flight': key.in_flight, 'requests': key.requests, 'errors': key.errors,
+                              'window_requests': len(key.window),
+                              'quota_used': len(key.window) / key.quota if key.quota else None,
+                              'quarantined_for': max(key.quarantined_until - now, 0.0),
+                              'quarantine_reason': key.quarantine_reason if key.quarantined_until > now else None})
+            return usage
@@ -1,6 +1,5 @@
 import time
 import datetime
-import requests
 import urllib.parse
 from lunarcrush.base import LunarCrushABC
 
@@ -8,8 +7,10 @@ from lunarcrush.base import LunarCrushABC
 class LunarCrush(LunarCrushABC):
     _BASE_URL = 'https://api2.lunarcrush.com/v2'
 
-    def __init__(self, api_key=None):
-        super().__init__(api_key)
+    def __init__(self, api_key=None, **kwargs):
+        super().__init__(api_key, **kwargs)
+        if self.key_pool is not None:
+            raise ValueError('API key pools are only supported by LunarCrushV3')
 
     @staticmethod
     def _parse_kwargs(kwargs):
@@ -26,11 +27,6 @@ class LunarCrush(LunarCrushABC):
         url += '&' + urllib.parse.urlencode(kwargs) if kwargs else ''
         return url
 
-    def _request(self, endpoint, **kwargs):
-        kwargs = self._parse_kwargs(kwargs)
-        url = self._gen_url(endpoint, **kwargs)
-        return requests.get(url).json()
-
     def get_assets(self, symbol: list, **kwargs) -> dict:
         """
         Details, overall metrics, and time series metrics for one or multiple assets.
@@ -95,13 +91,14 @@ class LunarCrush(LunarCrushABC):
         """
         return self._request('meta', **kwargs)
 
-    def get_exchange(self, exchange) -> dict:
+    def get_exchange(self, exchange, fields: list = None) -> dict:
         """
         Meta information and market pairs for a single exchange that we track
 
         :key str exchange: Lunar id of the exchange to fetch information for
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('exchange', exchange=exchange)
+        return self._request('exchange', exchange=exchange, fields=fields)
 
     def get_exchanges(self, **kwargs) -> dict:
         """
@@ -112,18 +109,22 @@ class LunarCrush(LunarCrushABC):
         """
         return self._request('exchanges', **kwargs)
 
-    def get_coin_of_the_day(self) -> dict:
+    def get_coin_of_the_day(self, fields: list = None) -> dict:
         """
         The current coin of the day
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('coinoftheday')
+        return self._request('coinoftheday', fields=fields)
 
-    def get_coin_of_the_day_info(self) -> dict:
+    def get_coin_of_the_day_info(self, fields: list = None) -> dict:
         """
         Provides the history of the coin of the day on LunarCRUSH when it was last changed, and when each coin was
         last coin of the day
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('coinoftheday_info')
+        return self._request('coinoftheday_info', fields=fields)
 
     def get_feeds(self, symbol: list, **kwargs) -> dict:
         """
@@ -1,17 +1,82 @@
 import time
 import datetime
-import requests
 import urllib.parse
 from lunarcrush.base import LunarCrushABC
+from lunarcrush.universe import UniverseIndex
 
 
 class LunarCrushV3(LunarCrushABC):
     _BASE_URL = 'https://lunarcrush.com/api3'
 
-    def __init__(self, api_key):
-        super().__init__(api_key)
-        self.coin_ids = {coin.get('symbol'): coin.get('id') for coin in self.get_coins_list()['data']}
-        self.nft_ids = {nft.get('name'): nft.get('id') for nft in self.get_nfts_list()['data']}
+    def __init__(self, api_key, **kwargs):
+        super().__init__(api_key, **kwargs)
+        self._coins_list = None
+        self._nfts_list = None
+        self._coin_ids = None
+        self._nft_ids = None
+        self._coin_index = None
+        self._nft_index = None
+
+    # coin and nft listings are only fetched the first time they are needed
+
+    def _coins(self):
+        if self._coins_list is None:
+            with self._inner_requests():
+                self._coins_list = self.get_coins_list()
+        return self._coins_list
+
+    def _nfts(self):
+        if self._nfts_list is None:
+            with self._inner_requests():
+                self._nfts_list = self.get_nfts_list()
+        return self._nfts_list
+
+    # listing fields ranking entries that share a symbol, the first one present is used
+    _RANK_KEYS = ('market_cap_rank', 'alt_rank')
+
+    def _index(self, listing):
+        rank_key = next((key for key in self._RANK_KEYS if any(row.get(key) is not None for row in listing['data'])),
+                        None)
+        return UniverseIndex.from_response(listing, rank_key=rank_key)
+
+    @property
+    def coin_ids(self) -> dict:
+        """
+        Id of every coin by symbol. Colliding symbols map to the best ranked coin, see ``coin_index``.
+        """
+        if self._coin_ids is None:
+            index = self.coin_index
+            self._coin_ids = {symbol: index.by_symbol(symbol)[0]['id'] for symbol in set(index.symbols)}
+        return self._coin_ids
+
+    @property
+    def nft_ids(self) -> dict:
+        """
+        Id of every NFT collection by name. Colliding names map to the best ranked collection, see ``nft_index``.
+        """
+        if self._nft_ids is None:
+            index = self.nft_index
+            self._nft_ids = {name: index.by_name(name)[0]['id'] for name in set(index.names)}
+        return self._nft_ids
+
+    @property
+    def coin_index(self) -> UniverseIndex:
+        """
+        Index of the coin listing. Coins sharing a symbol are ordered by market cap rank, or AltRank™, when the
+        listing provides one, and by id (oldest listing first) otherwise.
+        """
+        if self._coin_index is None:
+            self._coin_index = self._index(self._coins())
+        return self._coin_index
+
+    @property
+    def nft_index(self) -> UniverseIndex:
+        """
+        Index of the NFT listing, ordered like ``coin_index``.
+        """
+        if self._nft_index is None:
+            self._nft_index = self._index(self._nfts())
+        return self._nft_index
 
     @staticmethod
     def _parse_kwargs(kwargs):
@@ -29,35 +94,60 @@ class LunarCrushV3(LunarCrushABC):
 
     def _gen_url(self, endpoint, **kwargs):
         url = self._BASE_URL + endpoint
-        url += '&' + urllib.parse.urlencode(kwargs) if kwargs else ''
+        url += '?' + urllib.parse.urlencode(kwargs) if kwargs else ''
         return url
 
-    def _request(self, endpoint, **kwargs):
-        kwargs = self._parse_kwargs(kwargs)
-        url = self._gen_url(endpoint, **kwargs)
-        headers = {'Authorization': f'Bearer {self._api_key}'}
-        return requests.get(url, headers=headers).json()
+    # second path segments that are part of the route rather than a coin, nft or other id
+    _ROUTE_SEGMENTS = frozenset({'global', 'list', 'influencers', 'insights', 'info', 'summary'})
+
+    def _endpoint_template(self, endpoint):
+        parts = endpoint.split('/')
+        if len(parts) > 2 and parts[2] not in self._ROUTE_SEGMENTS:
+            parts[2] = '*'
+        return '/'.join(parts)
+
+    def _auth_headers(self, api_key):
+        return {'Authorization': f'Bearer {api_key}'}
 
     def get_coin_id(self, coin):
-        return str(self.coin_ids.get(coin))
+        """
+        Id of a coin given its symbol, name or id, as a string ('None' if unknown). Colliding symbols resolve to the
+        best ranked coin, see ``coin_index``.
+        """
+        try:
+            return str(self.coin_index.resolve(coin))
+        except KeyError:
+            return 'None'
 
     def get_nft_id(self, nft):
-        return str(self.nft_ids.get(nft))
+        """
+        Id of an NFT collection given its name or id, as a string ('None' if unknown). Colliding names resolve to
+        the best ranked collection, see ``nft_index``.
+        """
+        index = self.nft_index
+        if str(nft).isdigit() and nft in index:
+            return str(int(nft))
+        matches = index.by_name(str(nft))
+        return str(matches[0]['id']) if matches else 'None'
 
-    def get_coin_of_the_day(self) -> dict:
+    def get_coin_of_the_day(self, fields: list = None) -> dict:
         """
         Get the current LunarCrush Coin of the Day. Coin of the Day is the coin with the highest combination of
         Galaxy Score™ and AltRank™.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/coinoftheday')
+        return self._request('/coinoftheday', fields=fields)
 
-    def get_coin_of_the_day_info(self) -> dict:
+    def get_coin_of_the_day_info(self, fields: list = None) -> dict:
         """
         Get the previous history of Coin of the Day and when it was last updated.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/coinoftheday/info')
+        return self._request('/coinoftheday/info', fields=fields)
 
-    def get_coins(self, sort: str = 'alt_rank', limit: int = None, desc: bool = False) -> dict:
+    def get_coins(self, sort: str = 'alt_rank', limit: int = None, desc: bool = False, fields: list = None) -> dict:
         """
         Get a general snapshot of LunarCrush metrics on the entire list of tracked coins. It is designed as a
         lightweight mechanism for monitoring the universe of available assets, either in aggregate or relative to each
@@ -71,10 +161,11 @@ class LunarCrushV3(LunarCrushABC):
                          'volume', 'volume', 'market_dominance', 'market_cap_rank', 'holders', 'nfts', 'crypto_usd'.
         :param int limit: Limit the number of results.
         :param bool desc: Pass any value as desc and the output will be reversed (descending).
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/coins', sort=sort, limit=limit, desc=desc)
+        return self._request('/coins', sort=sort, limit=limit, desc=desc, fields=fields)
 
-    def get_coin(self, coin: str or int) -> dict:
+    def get_coin(self, coin: str or int, fields: list = None) -> dict:
         """
         Get a robust and detailed snapshot of a specific coin's metrics. This endpoint was designed to provide a
         granular look at the coin at the timestamp that the call is made. Depending on the call frequency, can be used
@@ -84,10 +175,11 @@ class LunarCrushV3(LunarCrushABC):
         coin in the input parameter, which can be found by calling the FREE /coins/list endpoint.
 
         :param str coin: Pass any value as desc and the output will be reversed (descending).
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/coins/{coin}')
+        return self._request(f'/coins/{coin}', fields=fields)
 
-    def get_coin_change(self, coin: str or int, interval: str = '1w') -> dict:
+    def get_coin_change(self, coin: str or int, interval: str = '1w', fields: list = None) -> dict:
         """
         Get percentage change metrics for provided coin id or symbol. The endpoint returns all the same metrics as the
         /coins/:coin endpoint, but relative to a specified interval prior to the time of call. For example, calling the
@@ -96,10 +188,11 @@ class LunarCrushV3(LunarCrushABC):
 
         :param str or int coin: Provide the numeric id or symbol of the coin or token.
         :param str interval: The % change since time interval to use. Options: '1d', '1w', '1m', '3m', '6m', '1y', '2y'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/coins/{coin}/change', interval=interval)
+        return self._request(f'/coins/{coin}/change', interval=interval, fields=fields)
 
-    def get_coin_historical(self, coin: str or int) -> dict:
+    def get_coin_historical(self, coin: str or int, fields: list = None) -> dict:
         """
         Get a full hourly time series data dump for all metrics provided by /coins/:coin/time-series endpoint. It is
         designed to be a cheaper alternative for grabbing full historical data (as opposed to a specified interval) for
@@ -107,11 +200,12 @@ class LunarCrushV3(LunarCrushABC):
         completed day.
 
         :param str or int coin: Provide the numeric id or symbol of the coin or token.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/coins/{coin}/historical')
+        return self._request(f'/coins/{coin}/historical', fields=fields)
 
     def get_coin_influencers(self, coin: str or int, interval: str = '1w', order: str = 'influential',
-                             limit: int = 100, page: int = None) -> dict:
+                             limit: int = 100, page: int = None, fields: list = None) -> dict:
         """
         Get a list a crypto influencers for a specified coin or token. It is sorted on influencer_rank (influential)
         by default but can be sorted by engagement, follower, or social media volume by specifying the sort criteria
@@ -124,10 +218,12 @@ class LunarCrushV3(LunarCrushABC):
         :param str order: Order results. Options: 'influential', 'engagement', 'followers', 'volume'.
         :param int limit: Limit the number of results.
         :param int page: Page number starting at 0.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/coins/{coin}/influencers', interval=interval, order=order, limit=limit, page=page)
+        return self._request(f'/coins/{coin}/influencers', interval=interval, order=order, limit=limit, page=page,
+                             fields=fields)
 
-    def get_coin_insights(self, coin: str or int, metrics: str = None, limit: int = 10) -> dict:
+    def get_coin_insights(self, coin: str or int, metrics: str = None, limit: int = 10, fields: list = None) -> dict:
         """
         Get a list of LunarCrush insights for a specific coin or token. Insights are generated for any anomalies in the
         data or for any significant deviations from the moving average on a specific metric e.g. bullish sentiment
@@ -142,20 +238,22 @@ class LunarCrushV3(LunarCrushABC):
                             'social_volume', 'social_score', 'social_dominance', 'social_contributors', 'market_cap',
                             'volume', 'market_dominance'.
         :param int limit: Limit the number of results.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/coins/{coin}/insights', metrics=metrics, limit=limit)
+        return self._request(f'/coins/{coin}/insights', metrics=metrics, limit=limit, fields=fields)
 
-    def get_coin_meta(self, coin: str or int) -> dict:
+    def get_coin_meta(self, coin: str or int, fields: list = None) -> dict:
         """
         Get all of a coin's basic descriptive data. This includes a coin's description, official social media links,
         white paper, etc.
 
         :param str or int coin: Provide the numeric id or symbol of the coin or token.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/coins/{coin}/meta')
+        return self._request(f'/coins/{coin}/meta', fields=fields)
 
     def get_coin_time_series(self, coin: str or int, interval: str = '1w', start: datetime.datetime = None,
-                             bucket: str = 'hour', data_points: int = None) -> dict:
+                             bucket: str = 'hour', data_points: int = None, fields: list = None) -> dict:
         """
         Get the same metrics available on the /coins/:coin endpoint in a series of discrete, memorialized time buckets
         (hourly or daily) over a certain time interval beginning at a specified start time. This time series endpoint
@@ -168,21 +266,23 @@ class LunarCrushV3(LunarCrushABC):
         :param datetime.datetime start: The start time (datetime.datetime) to go back to.
         :param str bucket: Use hour or day time buckets / aggregates. Options: 'hour', 'day'.
         :param int data_points: The number of data points to fetch from the start time.
-
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
         return self._request(f'/coins/{coin}/time-series',
-                             interval=interval, start=start, bucket=bucket, data_points=data_points)
+                             interval=interval, start=start, bucket=bucket, data_points=data_points, fields=fields)
 
-    def get_coins_global(self) -> dict:
+    def get_coins_global(self, fields: list = None) -> dict:
         """
         Get aggregated metrics across all coins tracked on the LunarCrush platform at the time of call. This is designed
         to be a global snapshot of the entire market, and tracks the same social metrics - e.g. url shares, reddit
         volumes, twitter, twitter sentiment, social score, social volume, average sentiment - as well a few metrics only
         applicable to the global schema like btc dominance, altcoin market cap, altcoin dominance.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/coins/global')
+        return self._request('/coins/global', fields=fields)
 
-    def get_coins_global_change(self, interval: str = '1w') -> dict:
+    def get_coins_global_change(self, interval: str = '1w', fields: list = None) -> dict:
         """
         Get percentage change metrics for aggregated metrics across all coins tracked on the LunarCrush platform. The
         endpoint returns all the same metrics as the /coins/global endpoint, but relative to a specified interval prior
@@ -191,28 +291,32 @@ class LunarCrushV3(LunarCrushABC):
         most recent 1 week vs. the 1 week prior to that.
 
         :param str interval: The time interval to use. Options: '1d', '1w', '1m', '3m', '6m', '1y', '2y', 'a'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/coins/global/change', interval=interval)
+        return self._request('/coins/global/change', interval=interval, fields=fields)
 
-    def get_coins_global_historical(self) -> dict:
+    def get_coins_global_historical(self, fields: list = None) -> dict:
         """
         The full historical hourly time series data for cryptocurrency global metrics. This is usually a > 30mb download
         and only includes data up to the most recently completed day.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/coins/global/historical')
+        return self._request('/coins/global/historical', fields=fields)
 
-    def get_coins_global_insights(self, metrics: str = None, limit: int = 10) -> dict:
+    def get_coins_global_insights(self, metrics: str = None, limit: int = 10, fields: list = None) -> dict:
         """
         Get a list of global cryptocurrency insights.
 
         :param str metrics: Filter insights to specific metrics. Options: 'social_volume', 'social_score',
                             'social_contributors', 'market_cap', 'volume'.
         :param int limit: Limit the number of results.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/coins/global/insights', metrics=metrics, limit=limit)
+        return self._request('/coins/global/insights', metrics=metrics, limit=limit, fields=fields)
 
     def get_coins_global_time_series(self, interval: str = '1w', start: datetime.datetime = None,
-                                     bucket: str = 'hour', data_points: int = None) -> dict:
+                                     bucket: str = 'hour', data_points: int = None, fields: list = None) -> dict:
         """
         Get the same metrics available on the /coins/global endpoint in a series of discrete, memorialized time buckets
         (hourly or daily) over a certain time interval beginning at a specified start time. This time series endpoint
@@ -224,13 +328,13 @@ class LunarCrushV3(LunarCrushABC):
         :param datetime.datetime start: The start time (datetime.datetime) to go back to.
         :param str bucket: Use hour or day time buckets / aggregates. Options: 'hour', 'day'.
         :param int data_points: The number of data points to fetch from the start time.
-
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
         return self._request('/coins/global/time-series',
-                             interval=interval, start=start, bucket=bucket, data_points=data_points)
+                             interval=interval, start=start, bucket=bucket, data_points=data_points, fields=fields)
 
     def get_coins_influencers(self, interval: str = '1w', order: str = 'influential',
-                              limit: int = 100, page: int = None) -> dict:
+                              limit: int = 100, page: int = None, fields: list = None) -> dict:
         """
         Get a list of overall crypto influencers across all coins. It is sorted on influencer_rank (influential) by
         default but can be sorted by engagement, follower, or social media volume by specifying the sort criteria in the
@@ -242,11 +346,14 @@ class LunarCrushV3(LunarCrushABC):
         :param str order: Order results. Options: 'influential', 'engagement', 'followers', 'volume'.
         :param int limit: Limit the number of results.
         :param int page: Page number starting at 0.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/coins/influencers', interval=interval, order=order, limit=limit, page=page)
+        return self._request('/coins/influencers', interval=interval, order=order, limit=limit, page=page,
+                             fields=fields)
 
     def get_coins_insights(self, metrics: str = None, limit: int = 10,
-                           volume: float = None, market_cap: float = None, alt_rank: int = None) -> dict:
+                           volume: float = None, market_cap: float = None, alt_rank: int = None,
+                           fields: list = None) -> dict:
         """
         Get a list of LunarCrush insights over all coins tracked on the LunarCrush platform. Insights are generated for
         any anomalies in the data or for any significant deviations from the moving average on a specific metric e.g.
@@ -262,37 +369,44 @@ class LunarCrushV3(LunarCrushABC):
         :param float volume: Minimum 24h volume on the coin to filter by.
         :param float market_cap: Minimum market cap on the coin to filter by.
         :param int alt_rank: Maximum alt rank on the coin to filter by.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
         return self._request('/coins/insights',
-                             metrics=metrics, limit=limit, volume=volume, market_cap=market_cap, alt_rank=alt_rank)
+                             metrics=metrics, limit=limit, volume=volume, market_cap=market_cap, alt_rank=alt_rank,
+                             fields=fields)
 
-    def get_coins_list(self) -> dict:
+    def get_coins_list(self, fields: list = None) -> dict:
         """
         Get a list of all supported coins in one output. Includes a coin's LunarCrush id, name, symbol
         and link to the coin's logo.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/coins/list')
+        return self._request('/coins/list', fields=fields)
 
-    def get_exchanges(self, order: str = '1m', limit: int = 10) -> dict:
+    def get_exchanges(self, order: str = '1m', limit: int = 10, fields: list = None) -> dict:
         """
         Get a list of all exchanges along with global exchange metrics.
 
         :param str order: The metric to order the results by. Options: 'trust_rank', '1d_volume', '1d_volume_percent',
                           '1d_trades', '30d_volume', '30d_volume_percent', '30d_trades', 'num_pairs'
         :param int limit: Limit the number of results.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/exchanges', order=order, limit=limit)
+        return self._request('/exchanges', order=order, limit=limit, fields=fields)
 
-    def get_exchange(self, exchange: int) -> dict:
+    def get_exchange(self, exchange: int, fields: list = None) -> dict:
         """
         Gets detail for a provided exchange including metrics and market pairs.
 
         :param exchange: The id or lunar id of the exchange.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/exchanges/{exchange}')
+        return self._request(f'/exchanges/{exchange}', fields=fields)
 
     def get_feeds(self, limit: int = 10, since: str = '1m', hours: int = None, days: int = None, sources: str = None,
-                  coin_id: int = None, symbol: str = None, lunar_id: int = None, market: str = 'coins') -> dict:
+                  coin_id: int = None, symbol: str = None, lunar_id: int = None, market: str = 'coins',
+                  fields: list = None) -> dict:
         """
         Get a list of relevant, highly-engaged social media posts  with the ability to filter by a specific coin or
         NFT asset, as well as a general category (coin or NFT). Additional filters include selected time intervals
@@ -310,19 +424,22 @@ class LunarCrushV3(LunarCrushABC):
         :param str symbol: The symbol of a coin to filter feeds by.
         :param int lunar_id: The lunar_id of an nft to filter feeds by.
         :param str market: Choose an asset market. Options: 'coins', 'nfts'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
         return self._request('/feeds', limit=limit, since=since, hours=hours, days=days, sources=sources,
-                             coin_id=coin_id, symbol=symbol, lunar_id=lunar_id, market=market)
+                             coin_id=coin_id, symbol=symbol, lunar_id=lunar_id, market=market, fields=fields)
 
-    def get_feed(self, feed: str) -> dict:
+    def get_feed(self, feed: str, fields: list = None) -> dict:
         """
         Get high-detail metrics for a specific feed post.
 
         :param str feed: Provide the lunar id of the feed item to get details for, i.e. 'tweets-1559564427413729287'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/feeds/{feed}')
+        return self._request(f'/feeds/{feed}', fields=fields)
 
-    def get_influencer(self, influencer: str, fast: bool = False, interval: str = None, sort: str = None) -> dict:
+    def get_influencer(self, influencer: str, fast: bool = False, interval: str = None, sort: str = None,
+                       fields: list = None) -> dict:
         """
         Get high-detail metrics for a specific influencer. Includes profile information, social volume and engagement
         rank, stats, influence ranks on a list of tokens, and a list of tweets or content data from the influencer.
@@ -333,20 +450,23 @@ class LunarCrushV3(LunarCrushABC):
         :param bool fast: Pass True here for the fast output without list of tweets.
         :param str interval: The time interval to get data for. Options: '1d', '1w', '1m', '3m', '6m', '1y', '2y', 'all'.
         :param str sort: Metric to sort the tweets by. Options: 'time'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/influencers/{influencer}', fast=fast, interval=interval, sort=sort)
+        return self._request(f'/influencers/{influencer}', fast=fast, interval=interval, sort=sort, fields=fields)
 
-    def get_insight(self, insight: str, type_: str = 'coins') -> dict:
+    def get_insight(self, insight: str, type_: str = 'coins', fields: list = None) -> dict:
         """
         Get details on a specific insight (specified by insight ID).
 
         :param str type_: The type of insight to fetch. Options: 'coins', 'nfts', 'global', 'nfts-global',
                           'influencers'.
         :param str insight: The ID of the insight to fetch details for, i.e. 'D1l133'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/insights/{insight}', type=type_)
+        return self._request(f'/insights/{insight}', type=type_, fields=fields)
 
-    def get_market_pairs(self, coin: str or int, limit: int = 100, page: int = 100, sort: str = None) -> dict:
+    def get_market_pairs(self, coin: str or int, limit: int = 100, page: int = 100, sort: str = None,
+                         fields: list = None) -> dict:
         """
         Get a full list of market pairs across all available exchanges, and the data pertaining to the specific market
         exchange pair for any coin id or symbol. Data on each pair includes the exchange id, 1-day trading metrics,
@@ -359,23 +479,28 @@ class LunarCrushV3(LunarCrushABC):
         :param page: Page number starting at 0.
         :param sort: Sort the output by a metric. Options: 'name', 'market_sort', 'price', '1d_volume', '30d_volume',
                      'type', 'last_updated'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/market-pairs/{coin}', limit=limit, page=page, sort=sort)
+        return self._request(f'/market-pairs/{coin}', limit=limit, page=page, sort=sort, fields=fields)
 
-    def get_nft_of_the_day(self) -> dict:
+    def get_nft_of_the_day(self, fields: list = None) -> dict:
         """
         Get current LunarCrush NFT of the Day. The NFT of the Day is selected based on the collection with the
         highest combination of NFT Score™ and NFTRank™
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/nftoftheday')
+        return self._request('/nftoftheday', fields=fields)
 
-    def get_nft_of_the_day_info(self) -> dict:
+    def get_nft_of_the_day_info(self, fields: list = None) -> dict:
         """
         Get the previous history of NFT of the Day and when it was last updated.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/nftoftheday/info')
+        return self._request('/nftoftheday/info', fields=fields)
 
-    def get_nfts(self, sort: str = 'alt_rank', limit: int = None, desc: bool = False) -> dict:
+    def get_nfts(self, sort: str = 'alt_rank', limit: int = None, desc: bool = False, fields: list = None) -> dict:
         """
         Get a general snapshot of LunarCrush metrics on the entire list of tracked NFTs. It is designed as a lightweight
         mechanism for monitoring the universe of available NFT collections, either in aggregate or relative to each
@@ -390,10 +515,11 @@ class LunarCrushV3(LunarCrushABC):
                      'market_dominance', 'market_cap_rank', 'holders', 'nfts', 'crypto_usd'.
         :param limit: Limit the number of results.
         :param desc: Pass any value as desc and the output will be reversed (descending).
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/nfts', sort=sort, limit=limit, desc=desc)
+        return self._request('/nfts', sort=sort, limit=limit, desc=desc, fields=fields)
 
-    def get_nft(self, nft: str or int) -> dict:
+    def get_nft(self, nft: str or int, fields: list = None) -> dict:
         """
         Get a robust and detailed snapshot of a specific NFT collection's metrics. This endpoint was designed to provide
         a granular look at the collection at the timestamp that the call is made. Depending on the call frequency, can
@@ -403,10 +529,11 @@ class LunarCrushV3(LunarCrushABC):
         of the coin in the input parameter, which can be found by calling the FREE /coins/list endpoint.
 
         :param nft: Provide the numeric id or lunar id of the NFT collection.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/nft/{nft}')
+        return self._request(f'/nft/{nft}', fields=fields)
 
-    def get_nft_change(self, nft: str or int, interval: str = '1w') -> dict:
+    def get_nft_change(self, nft: str or int, interval: str = '1w', fields: list = None) -> dict:
         """
         Get percentage change metrics for provided nft id or lunar id. The endpoint returns all the same metrics as the
         /nfts/:nft endpoint, but relative to a specified interval prior to the time of call. For example, calling the
@@ -415,10 +542,11 @@ class LunarCrushV3(LunarCrushABC):
 
         :param nft: Provide the numeric id or lunar id of the NFT.
         :param str interval: The % change since time interval to use. Options: '1d', '1w', '1m', '3m', '6m', '1y', '2y'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/nfts/{nft}/change', interval=interval)
+        return self._request(f'/nfts/{nft}/change', interval=interval, fields=fields)
 
-    def get_nft_historical(self, nft: str or int) -> dict:
+    def get_nft_historical(self, nft: str or int, fields: list = None) -> dict:
         """
         Get a full hourly time series data dump for all metrics provided by /nfts/:nft/time-series endpoint. It is
         designed to be a cheaper alternative for grabbing full historical data (as opposed to a specified interval) for
@@ -426,11 +554,12 @@ class LunarCrushV3(LunarCrushABC):
         completed day.
 
         :param str or int nft: Provide the numeric id or symbol of the NFT or token.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/nfts/{nft}/historical')
+        return self._request(f'/nfts/{nft}/historical', fields=fields)
 
     def get_nft_influencers(self, nft: str or int, interval: str = '1w', order: str = 'influential',
-                            limit: int = 100, page: int = None) -> dict:
+                            limit: int = 100, page: int = None, fields: list = None) -> dict:
         """
         Get a list of crypto influencers for a specified nft collection. It is sorted on influencer_rank (influential)
         by default but can be sorted by engagement, follower, or social media volume by specifying the sort criteria in
@@ -443,10 +572,12 @@ class LunarCrushV3(LunarCrushABC):
         :param str order: Order results. Options: 'influential', 'engagement', 'followers', 'volume'.
         :param int limit: Limit the number of results.
         :param int page: Page number starting at 0.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/nfts/{nft}/influencers', interval=interval, order=order, limit=limit, page=page)
+        return self._request(f'/nfts/{nft}/influencers', interval=interval, order=order, limit=limit, page=page,
+                             fields=fields)
 
-    def get_nft_insights(self, nft: str or int, metrics: str = None, limit: int = 10) -> dict:
+    def get_nft_insights(self, nft: str or int, metrics: str = None, limit: int = 10, fields: list = None) -> dict:
         """
         Get a list of LunarCrush insights for a specific NFT collection. Insights are generated for any anomalies in the
         data or for any significant deviations from the moving average on a specific metric e.g. social contributors
@@ -459,11 +590,12 @@ class LunarCrushV3(LunarCrushABC):
         :param str metrics: Filter insights to specific metrics. Options: 'social_volume', 'social_score',
                             'social_dominance', 'social_contributors', 'market_cap'.
         :param int limit: Limit the number of results.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/nfts/{nft}/insights', metrics=metrics, limit=limit)
+        return self._request(f'/nfts/{nft}/insights', metrics=metrics, limit=limit, fields=fields)
 
     def get_nft_time_series(self, nft: str or int, interval: str = '1w', start: datetime.datetime = None,
-                            bucket: str = 'hour', data_points: int = None) -> dict:
+                            bucket: str = 'hour', data_points: int = None, fields: list = None) -> dict:
         """
         Get the same metrics available on the /nfts/:nft endpoint in a series of discrete, memorialized time buckets
         (hourly or daily) over a certain time interval beginning at a specified start time. This time series endpoint
@@ -476,13 +608,13 @@ class LunarCrushV3(LunarCrushABC):
         :param datetime.datetime start: The start time (datetime.datetime) to go back to.
         :param str bucket: Use hour or day time buckets / aggregates. Options: 'hour', 'day'.
         :param int data_points: The number of data points to fetch from the start time.
-
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
         return self._request(f'/nfts/{nft}/time-series',
-                             interval=interval, start=start, bucket=bucket, data_points=data_points)
+                             interval=interval, start=start, bucket=bucket, data_points=data_points, fields=fields)
 
     def get_nft_tokens(self, nft: str or int, sort: str = 'last_sold_amount',
-                       limit: int = 100, desc: bool = False) -> dict:
+                       limit: int = 100, desc: bool = False, fields: list = None) -> dict:
         """
         Get details on all tokens within an NFT collection. An NFT collection more than often consists of a few discrete
         non-fungible tokens within the collection, provisioned by the same smart contract. The data returned here is a
@@ -493,19 +625,22 @@ class LunarCrushV3(LunarCrushABC):
         :param sort: sort the output by metric. Options: 'last_sold_amount', 'last_sold_time', 'name'.
         :param limit: limit the number of results.
         :param desc: "True" to reverse the sorted order.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         :return:
         """
-        return self._request(f'/nfts/{nft}/tokens', sort=sort, limit=limit, desc=desc)
+        return self._request(f'/nfts/{nft}/tokens', sort=sort, limit=limit, desc=desc, fields=fields)
 
-    def get_nfts_global(self) -> dict:
+    def get_nfts_global(self, fields: list = None) -> dict:
         """
         Get aggregated metrics across all NFT collections tracked on the LunarCrush platform at the time of call. This
         is designed to be a global snapshot of the entire NFT market, and tracks the same social metrics - e.g. url
         shares, reddit volumes, twitter, twitter sentiment, social score, social volume, average sentiment.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/nfts/global')
+        return self._request('/nfts/global', fields=fields)
 
-    def get_nfts_global_change(self, interval: str = '1w') -> dict:
+    def get_nfts_global_change(self, interval: str = '1w', fields: list = None) -> dict:
         """
         Get percentage change metrics for aggregated metrics across all NFT collections tracked on the LunarCrush
         platform. The endpoint returns all the same metrics as the /nfts/global endpoint, but relative to a specified
@@ -514,17 +649,20 @@ class LunarCrushV3(LunarCrushABC):
         period, e.g. most recent 1 week vs. the 1 week prior to that.
 
         :param str interval: The time interval to use. Options: '1d', '1w', '1m', '3m', '6m', '1y', '2y', 'a'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/nfts/global/change', interval=interval)
+        return self._request('/nfts/global/change', interval=interval, fields=fields)
 
-    def get_nfts_global_historical(self) -> dict:
+    def get_nfts_global_historical(self, fields: list = None) -> dict:
         """
         The full historical hourly time series data for nft global metrics. This is usually a > 10mb download and only
         includes data up to the most recently completed day.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/nfts/global/historical')
+        return self._request('/nfts/global/historical', fields=fields)
 
-    def get_nfts_global_insights(self, metrics: str = None, limit: int = 10) -> dict:
+    def get_nfts_global_insights(self, metrics: str = None, limit: int = 10, fields: list = None) -> dict:
         """
         Get a list of LunarCrush insights for the global aggregated metrics across all NFT collections. Insights are
         generated for any anomalies in the data or for any significant deviations from the moving average on a specific
@@ -538,11 +676,12 @@ class LunarCrushV3(LunarCrushABC):
                             moving average. Options: 'social_volume', 'social_score', 'social_contributors',
                             'market_cap', 'volume'.
         :param int limit: Limit the number of results.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/nfts/global/insights', metrics=metrics, limit=limit)
+        return self._request('/nfts/global/insights', metrics=metrics, limit=limit, fields=fields)
 
     def get_nfts_global_time_series(self, interval: str = '1w', start: datetime.datetime = None,
-                                    bucket: str = 'hour', data_points: int = None) -> dict:
+                                    bucket: str = 'hour', data_points: int = None, fields: list = None) -> dict:
         """
         Get the same metrics available on the /nfts/global endpoint in a series of discrete, memorialized time buckets
         (hourly or daily) over a certain time interval beginning at a specified start time. This time series endpoint
@@ -554,13 +693,13 @@ class LunarCrushV3(LunarCrushABC):
         :param datetime.datetime start: The start time (datetime.datetime) to go back to.
         :param str bucket: Use hour or day time buckets / aggregates. Options: 'hour', 'day'.
         :param int data_points: The number of data points to fetch from the start time.
-
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
         return self._request('/nfts/global/time-series',
-                             interval=interval, start=start, bucket=bucket, data_points=data_points)
+                             interval=interval, start=start, bucket=bucket, data_points=data_points, fields=fields)
 
     def get_nfts_influencers(self, interval: str = '1w', order: str = 'influential',
-                             limit: int = 100, page: int = None) -> dict:
+                             limit: int = 100, page: int = None, fields: list = None) -> dict:
         """
         Get a list of overall crypto influencers across all NFTs. It is sorted on influencer_rank (influential) by
         default but can be sorted by engagement, follower, or social media volume by specifying the sort criteria in
@@ -572,11 +711,13 @@ class LunarCrushV3(LunarCrushABC):
         :param str order: Order results. Options: 'influential', 'engagement', 'followers', 'volume'.
         :param int limit: Limit the number of results.
         :param int page: Page number starting at 0.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/nfts/influencers', interval=interval, order=order, limit=limit, page=page)
+        return self._request('/nfts/influencers', interval=interval, order=order, limit=limit, page=page, fields=fields)
 
     def get_nfts_insights(self, metrics: str = None, limit: int = 10,
-                          volume: float = None, market_cap: float = None, alt_rank: int = None) -> dict:
+                          volume: float = None, market_cap: float = None, alt_rank: int = None,
+                          fields: list = None) -> dict:
         """
         Get a list of LunarCrush insights across all NFT collections. Insights are generated for any anomalies in the
         data or for any significant deviations from the moving average on a specific metric e.g. bullish sentiment
@@ -592,17 +733,21 @@ class LunarCrushV3(LunarCrushABC):
         :param float volume: Minimum 24h volume on the NFT to filter by.
         :param float market_cap: Minimum market cap on the NFT to filter by.
         :param int alt_rank: Maximum alt rank on the NFT to filter by.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
         return self._request(f'/nfts/insights',
-                             metrics=metrics, limit=limit, volume=volume, market_cap=market_cap, alt_rank=alt_rank)
+                             metrics=metrics, limit=limit, volume=volume, market_cap=market_cap, alt_rank=alt_rank,
+                             fields=fields)
 
-    def get_nfts_list(self) -> dict:
+    def get_nfts_list(self, fields: list = None) -> dict:
         """
         Get a list of all supported NFTs in one output.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/nfts/list')
+        return self._request('/nfts/list', fields=fields)
 
-    def get_opinions(self, context: str = None, sort: str = None) -> dict:
+    def get_opinions(self, context: str = None, sort: str = None, fields: list = None) -> dict:
         """
         Get index of opinions for the main opinions screen. LunarCrush opinions are surveyed across all coin,
         NFT collection, influencer, social media content assets for bullish/bearish, quality, and other points of
@@ -611,43 +756,53 @@ class LunarCrushV3(LunarCrushABC):
 
         :param context: Select the context. Options: 'all', 'global', 'coin', 'nft', 'feed', 'exchange', 'influencer'.
         :param sort: Sort the results by. Options: 'all', 'positive', 'negative', 'split'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/opinions', context=context, sort=sort)
+        return self._request('/opinions', context=context, sort=sort, fields=fields)
 
-    def get_opinions_summary(self) -> dict:
+    def get_opinions_summary(self, fields: list = None) -> dict:
         """
         Get summary stats for opinions.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/opinions/summary')
+        return self._request('/opinions/summary', fields=fields)
 
-    def get_spark(self, spark_id: str) -> dict:
+    def get_spark(self, spark_id: str, fields: list = None) -> dict:
         """
         Get the sparks information for a single identifier.
 
         :param spark_id: The unique identifier for the spark which is formatted as {context_type}-{context_id}
                          as a single string, i.e. 'feeds-twitter-1544881801687994369'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request(f'/sparks/{spark_id}')
+        return self._request(f'/sparks/{spark_id}', fields=fields)
 
-    def get_stats_lunrfi(self) -> dict:
+    def get_stats_lunrfi(self, fields: list = None) -> dict:
         """
         Get global LunrFi stats.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/stats/lunrfi')
+        return self._request('/stats/lunrfi', fields=fields)
 
-    def get_top_mentions(self, interval: str = 'all', type_: str = 'all', market: str = 'coins') -> dict:
+    def get_top_mentions(self, interval: str = 'all', type_: str = 'all', market: str = 'coins',
+                         fields: list = None) -> dict:
         """
         Get the top word, emoji, or hashtag mentions from influential content.
 
         :param interval: The time interval to use. Options: '1d', '1w', '1m', '3m', '6m', '1y', '2y', 'all'.
         :param type_: The type of mentions to show. Options: 'all', 'word', 'emoji', 'hashtag'.
         :param market: Choose an asset market. One of coins, nfts. Options: 'coins', 'nfts'.
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/top-mentions', interval=interval, type=type_, market=market)
+        return self._request('/top-mentions', interval=interval, type=type_, market=market, fields=fields)
 
-    def get_whatsup(self):
+    def get_whatsup(self, fields: list = None):
         """
         WhatsUp powers the LunarCrush live dashboard. Includes the current list of top metrics for coins, nfts
         and stocks. This endpoint is designed to be fetched as frequently as possible.
+
+        :param list fields: Only keep these fields of the data. A {field: type} dict also checks their types.
         """
-        return self._request('/whatsup')
+        return self._request('/whatsup', fields=fields)
@@ -0,0 +1,79 @@
+import json
+
+from lunarcrush.exceptions import SchemaError
+
+_MISSING = object()
+
+
+class Maybe:
+    """
+    Marks a field of a typed schema that may be missing from the data, e.g. ``{'market_cap': Maybe(float)}``.
+    """
+
+    def __init__(self, type_=None):
+        self.type = type_
+
+    def __repr__(self):
+        return f'Maybe({_type_name(self.type)})'
+
+
+def _type_name(type_):
+    # types may also be tuples of types, as accepted by isinstance
+    if isinstance(type_, tuple):
+        return ' or '.join(map(_type_name, type_))
+    return getattr(type_, '__name__', repr(type_))
+
+
+def _check(name, value, type_):
+    if value is None or type_ is None:
+        return value
+    if type_ is float and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if not isinstance(value, type_):
+        raise SchemaError(f'Field {name!r}: expected {_type_name(type_)}, got {type(value).__name__} {value!r}')
+    return value
+
+
+def _project_row(row, schema):
+    if not isinstance(row, dict):
+        return row
+    projected = {}
+    for name, (type_, required) in schema.items():
+        value = row.get(name, _MISSING)
+        if value is _MISSING:
+            if required:
+                raise SchemaError(f'Field {name!r} is missing, mark it Maybe if it may be')
+            value = None
+        projected[name] = _check(name, value, type_)
+    return projected
+
+
+def project(data, fields):
+    """
+    Keep only ``fields`` of ``data``, a single object or a list of rows.
+
+    :param data: The ``data`` of a response.
+    :param fields: List of field names, missing fields are set to None. Or a ``{name: type}`` dict to also check
+                   the type of every value (ints are accepted for float fields, None for any type). Fields of a
+                   dict are required unless their type is wrapped in ``Maybe``.
+    :raises SchemaError: if a value does not have the expected type or a required field is missing.
+    """
+    if isinstance(fields, dict):
+        schema = {name: (type_.type, False) if isinstance(type_, Maybe) else (type_, True)
+                  for name, type_ in fields.items()}
+    else:
+        schema = dict.fromkeys(fields, (None, False))
+    if isinstance(data, list):
+        return [_project_row(row, schema) for row in data]
+    return _project_row(data, schema)
+
+
+def loads(raw, fields) -> dict:
+    """
+    Decode a raw response body and project its ``data`` onto ``fields`` straight away, so only the requested
+    fields outlive the call.
+    """
+    response = json.loads(raw)
+    if fields is not None and isinstance(response, dict) and 'data' in response:
+        response['data'] = project(response['data'], fields)
+    return response
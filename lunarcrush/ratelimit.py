@@ -0,0 +1,34 @@
+import time
+import threading
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting the number of requests per second.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        """
+        :param float rate: Sustained number of requests per second.
+        :param int burst: Number of requests that can be issued back to back. Defaults to ``max(1, rate)``.
+        """
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a request can be issued.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
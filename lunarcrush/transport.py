@@ -0,0 +1,145 @@
+import weakref
+import threading
+
+
+class RequestsTransport:
+    """
+    HTTP transport backed by a ``requests.Session``. ``requests`` is imported and the session (with its connection
+    pool) is created on the first request, so building a client stays cheap.
+    """
+
+    def __init__(self):
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
+    @property
+    def timeout_errors(self) -> tuple:
+        import requests
+        return requests.Timeout,
+
+    @property
+    def connection_errors(self) -> tuple:
+        import requests
+        return requests.ConnectionError,
+
+    def get(self, url, headers=None, timeout=None):
+        return self.session.get(url, headers=headers, timeout=timeout)
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+
+async def _client_lifetime(client):
+    # async generator living as long as the event loop of ``client``: asyncio.run() finalizes the open async
+    # generators of its loop before closing it, which closes the client on its own loop
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+class HTTP2Transport:
+    """
+    HTTP/2 transport backed by ``httpx``, multiplexing concurrent requests over a few persistent connections.
+    Serves both the sync (``get``) and async (``aget``) code paths. Sync calls from any number of threads are run
+    on a private event loop so they share its connections. Async calls use one client per event loop, closed when
+    the loop is shut down by ``asyncio.run`` or by awaiting ``aclose``. Requires ``httpx[http2]``.
+    """
+
+    def __init__(self, max_connections: int = 4, http1: bool = True, **client_kwargs):
+        """
+        :param int max_connections: Maximum number of connections per host.
+        :param bool http1: Allow falling back to HTTP/1.1. Set to False to speak HTTP/2 without TLS (prior
+                           knowledge), e.g. against a local server.
+        :param client_kwargs: Extra arguments of ``httpx.AsyncClient``.
+        """
+        try:
+            import httpx
+            import h2  # noqa: F401
+        except ImportError as e:
+            raise ImportError('The HTTP/2 transport requires httpx[http2]: pip install lunarcrush[http2]') from e
+        import asyncio
+        self._asyncio = asyncio
+        self._httpx = httpx
+        self._kwargs = dict(client_kwargs, http2=True, http1=http1,
+                            limits=httpx.Limits(max_connections=max_connections))
+        self._clients = weakref.WeakKeyDictionary()  # event loop -> (AsyncClient, lifetime async generator)
+        self._loop = None
+        self._lock = threading.Lock()
+
+    async def _client(self):
+        loop = self._asyncio.get_running_loop()
+        with self._lock:
+            for other in [other for other in self._clients if other.is_closed()]:
+                del self._clients[other]  # loops closed without finalizing their async generators
+            entry = self._clients.get(loop)
+        if entry is None:
+            client = self._httpx.AsyncClient(**self._kwargs)
+            lifetime = _client_lifetime(client)
+            await lifetime.asend(None)  # registers the generator with the loop
+            entry = (client, lifetime)
+            with self._lock:
+                self._clients[loop] = entry
+        return entry[0]
+
+    @property
+    def clients(self) -> int:
+        """
+        Number of open clients, one per event loop that issued requests.
+        """
+        with self._lock:
+            return sum(not loop.is_closed() for loop in list(self._clients))
+
+    @property
+    def loop(self):
+        """
+        Event loop running the sync requests, started on the first one.
+        """
+        with self._lock:
+            if self._loop is None:
+                self._loop = self._asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='lunarcrush-http2', daemon=True).start()
+        return self._loop
+
+    @property
+    def timeout_errors(self) -> tuple:
+        return self._httpx.TimeoutException,
+
+    @property
+    def connection_errors(self) -> tuple:
+        return self._httpx.TransportError,
+
+    def get(self, url, headers=None, timeout=None):
+        return self._asyncio.run_coroutine_threadsafe(self.aget(url, headers, timeout), self.loop).result()
+
+    async def aget(self, url, headers=None, timeout=None):
+        client = await self._client()
+        return await client.get(url, headers=headers, timeout=timeout)
+
+    def close(self):
+        """
+        Close the client of the sync requests and stop their event loop.
+        """
+        if self._loop is not None:
+            self._asyncio.run_coroutine_threadsafe(self.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+    async def aclose(self):
+        """
+        Close the client of the running event loop. Needed for loops not run by ``asyncio.run``.
+        """
+        with self._lock:
+            entry = self._clients.pop(self._asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+
+
+TRANSPORTS = {'requests': RequestsTransport, 'http2': HTTP2Transport}
@@ -0,0 +1,166 @@
+import sys
+import array
+import bisect
+import struct
+
+_MAGIC = b'LCUX'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHI')
+
+
+class UniverseIndex:
+    """
+    Compact, array-backed index of the coins or NFTs tracked by LunarCrush, with lookups by id, symbol and name
+    and prefix search for autocompletion.
+
+    Entries are stored in parallel arrays sorted by id. Symbols may be shared by several coins, so ``by_symbol``
+    returns every match, ordered by ``rank`` (e.g. market cap rank) when one was provided.
+    """
+
+    def __init__(self, ids, symbols, names, ranks=None, _orders=None):
+        """
+        :param ids: Numeric ids, sorted ascending.
+        :param symbols: Symbol of each entry.
+        :param names: Name of each entry.
+        :param ranks: Optional rank of each entry, lower is better. Used to resolve symbol collisions.
+        """
+        self.ids = array.array('q', ids)
+        self.symbols = [sys.intern(symbol) for symbol in symbols]
+        self.names = [sys.intern(name) for name in names]
+        self.ranks = array.array('q', ranks if ranks is not None else [0] * len(self.ids))
+        if _orders is None:
+            rows = range(len(self.ids))
+            _orders = (array.array('q', sorted(rows, key=lambda row: (self.symbols[row].lower(), self.ranks[row]))),
+                       array.array('q', sorted(rows, key=lambda row: (self.names[row].lower(), self.ranks[row]))))
+        # rows ordered by lowercased symbol / name, so lookups and prefix searches are bisections
+        self._symbol_keys, self._name_keys = _orders
+        self._symbol_sorted = [self.symbols[row].lower() for row in self._symbol_keys]
+        self._name_sorted = [self.names[row].lower() for row in self._name_keys]
+
+    @classmethod
+    def from_response(cls, response: dict, rank_key: str = None) -> 'UniverseIndex':
+        """
+        Build an index from a ``get_coins_list``, ``get_nfts_list``, ``get_coins`` or ``get_nfts`` response.
+
+        :param dict response: Response of one of the listing endpoints.
+        :param str rank_key: Field used to order colliding symbols, e.g. 'market_cap_rank' or 'alt_rank'.
+        """
+        entries = sorted((entry for entry in response['data'] if entry.get('id') is not None),
+                         key=lambda entry: int(entry['id']))
+        ranks = None
+        if rank_key is not None:
+            ranks = [int(entry.get(rank_key) or sys.maxsize) for entry in entries]
+        return cls([int(entry['id']) for entry in entries],
+                   [entry.get('symbol') or '' for entry in entries],
+                   [entry.get('name') or '' for entry in entries],
+                   ranks)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, id_):
+        return self._row(id_) is not None
+
+    def _row(self, id_):
+        row = bisect.bisect_left(self.ids, int(id_))
+        return row if row < len(self.ids) and self.ids[row] == int(id_) else None
+
+    def _entry(self, row):
+        return {'id': self.ids[row], 'symbol': self.symbols[row], 'name': self.names[row]}
+
+    def get(self, id_) -> dict:
+        """
+        Entry with the given id, or None.
+        """
+        row = self._row(id_)
+        return None if row is None else self._entry(row)
+
+    def _lookup(self, keys, sorted_keys, value):
+        value = value.lower()
+        start = bisect.bisect_left(sorted_keys, value)
+        end = bisect.bisect_right(sorted_keys, value, lo=start)
+        return [self._entry(row) for row in keys[start:end]]
+
+    def by_symbol(self, symbol: str) -> list:
+        """
+        Every entry with the given symbol (case-insensitive), best ranked first.
+        """
+        return self._lookup(self._symbol_keys, self._symbol_sorted, symbol)
+
+    def by_name(self, name: str) -> list:
+        """
+        Every entry with the given name (case-insensitive), best ranked first.
+        """
+        return self._lookup(self._name_keys, self._name_sorted, name)
+
+    def resolve(self, coin) -> int:
+        """
+        Resolve a numeric id, symbol or name to an id. Colliding symbols resolve to the best ranked entry.
+
+        :raises KeyError: if nothing matches.
+        """
+        if isinstance(coin, int) or isinstance(coin, str) and coin.isdigit():
+            if coin in self:
+                return int(coin)
+        matches = self.by_symbol(str(coin)) or self.by_name(str(coin))
+        if not matches:
+            raise KeyError(coin)
+        return matches[0]['id']
+
+    def search(self, prefix: str, limit: int = 10) -> list:
+        """
+        Entries whose symbol or name starts with ``prefix`` (case-insensitive). Symbol matches come first.
+        """
+        prefix = prefix.lower()
+        results, seen = [], set()
+        for keys, sorted_keys in ((self._symbol_keys, self._symbol_sorted), (self._name_keys, self._name_sorted)):
+            start = bisect.bisect_left(sorted_keys, prefix)
+            for row, key in zip(keys[start:], sorted_keys[start:]):
+                if len(results) >= limit or not key.startswith(prefix):
+                    break
+                if row not in seen:
+                    seen.add(row)
+                    results.append(self._entry(row))
+        return results
+
+    def dumps(self) -> bytes:
+        """
+        Serialize the index to a compact binary blob.
+        """
+        strings = '\0'.join(self.symbols + self.names).encode('utf-8')
+        arrays = b''.join(_little_endian(values).tobytes()
+                          for values in (self.ids, self.ranks, self._symbol_keys, self._name_keys))
+        return _HEADER.pack(_MAGIC, _VERSION, len(self.ids)) + arrays + strings
+
+    @classmethod
+    def loads(cls, blob: bytes) -> 'UniverseIndex':
+        """
+        Load an index serialized with ``dumps``.
+        """
+        magic, version, count = _HEADER.unpack_from(blob)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('Not a LunarCrush universe index')
+        arrays = []
+        for i in range(4):
+            values = array.array('q')
+            values.frombytes(blob[_HEADER.size + 8 * count * i:_HEADER.size + 8 * count * (i + 1)])
+            arrays.append(_little_endian(values))
+        strings = blob[_HEADER.size + 32 * count:].decode('utf-8').split('\0') if count else []
+        return cls(arrays[0], strings[:count], strings[count:], arrays[1], _orders=(arrays[2], arrays[3]))
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def load(cls, path: str) -> 'UniverseIndex':
+        with open(path, 'rb') as f:
+            return cls.loads(f.read())
+
+
+def _little_endian(values):
+    if sys.byteorder == 'little':
+        return values
+    values = array.array(values.typecode, values)
+    values.byteswap()
+    return values
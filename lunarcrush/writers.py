@@ -0,0 +1,192 @@
+import os
+import csv
+import json
+
+
+def _columnar_value(value):
+    return json.dumps(value) if isinstance(value, (dict, list)) else value
+
+
+def _promote(pa, old, new):
+    if old.equals(new) or pa.types.is_null(new):
+        return old
+    if pa.types.is_null(old):
+        return new
+    if pa.types.is_integer(old) and pa.types.is_integer(new):
+        return pa.int64()
+    numeric = (pa.types.is_integer, pa.types.is_floating)
+    if any(check(old) for check in numeric) and any(check(new) for check in numeric):
+        return pa.float64()
+    return pa.string()
+
+
+def _merge_schemas(pa, schema, other):
+    fields = {field.name: field.type for field in schema}
+    for field in other:
+        fields[field.name] = _promote(pa, fields[field.name], field.type) if field.name in fields else field.type
+    return pa.schema(list(fields.items()))
+
+
+def _cast(pa, table, schema):
+    columns = [table.column(field.name).cast(field.type) if field.name in table.column_names
+               else pa.nulls(len(table), field.type) for field in schema]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+class NDJSONWriter:
+    """
+    Append rows to a newline-delimited JSON file.
+    """
+    extension = 'ndjson'
+    buffered = 0
+
+    def __init__(self, path: str, append: bool = True):
+        self.path = path
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, rows: list):
+        for row in rows:
+            self._file.write(json.dumps(row) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class CSVWriter:
+    """
+    Write rows to a CSV file. Columns are taken from the first rows written (or from the header of the file being
+    appended to), later unknown keys are dropped and nested values are stored as JSON strings.
+    """
+    extension = 'csv'
+    buffered = 0
+
+    def __init__(self, path: str, append: bool = True):
+        self.path = path
+        fieldnames = None
+        if append and os.path.exists(path) and os.path.getsize(path):
+            with open(path, newline='', encoding='utf-8') as f:
+                fieldnames = next(csv.reader(f))
+        self._file = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = None if fieldnames is None else self._dict_writer(fieldnames)
+
+    def _dict_writer(self, fieldnames):
+        return csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+
+    def write(self, rows: list):
+        if not rows:
+            return
+        if self._writer is None:
+            self._writer = self._dict_writer(list(dict.fromkeys(key for row in rows for key in row)))
+            self._writer.writeheader()
+        self._writer.writerows({key: _columnar_value(value) for key, value in row.items()} for row in rows)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Write rows to a Parquet dataset: a directory of part files, read back with e.g. ``pandas.read_parquet(path)``.
+    Every batch of ``batch_size`` rows is written to its own part file, which is complete and closed as soon as
+    the batch is flushed, so memory stays bounded and an interrupted run never leaves rows in an unreadable file.
+    Nested values are stored as JSON strings and columns missing from some rows as nulls. Column types are
+    promoted from batch to batch (null to int, int to float, mixed types to string); each part keeps the schema
+    known when it was written and ``read_parquet`` reads them back with a common one. Requires ``pyarrow``.
+    """
+    extension = 'parquet'
+
+    def __init__(self, path: str, append: bool = True, batch_size: int = 10000):
+        """
+        :param str path: Directory of the dataset.
+        :param bool append: Add part files to an existing dataset, otherwise its part files are removed.
+        :param int batch_size: Rows per part file.
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError('Parquet output requires pyarrow: pip install pyarrow') from e
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = path
+        self.batch_size = batch_size
+        self._buffer = []
+        os.makedirs(path, exist_ok=True)
+        parts = sorted(name for name in os.listdir(path) if name.startswith('part-') and name.endswith('.parquet'))
+        if not append:
+            for name in parts:
+                os.remove(os.path.join(path, name))
+            parts = []
+        self._parts = int(parts[-1][5:-8]) + 1 if parts else 0
+        self._schema = self._pq.read_schema(os.path.join(path, parts[-1])) if parts else self._pa.schema([])
+
+    @property
+    def buffered(self) -> int:
+        """
+        Number of rows written but not flushed to disk yet.
+        """
+        return len(self._buffer)
+
+    def write(self, rows: list):
+        self._buffer.extend({key: _columnar_value(value) for key, value in row.items()} for row in rows)
+        if len(self._buffer) >= self.batch_size:
+            self._flush()
+
+    def _column(self, values):
+        try:
+            return self._pa.array(values)
+        except (self._pa.ArrowInvalid, self._pa.ArrowTypeError):
+            return self._pa.array([None if value is None else str(value) for value in values],
+                                  type=self._pa.string())
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        names = list(dict.fromkeys(key for row in self._buffer for key in row))
+        table = self._pa.Table.from_arrays([self._column([row.get(name) for row in self._buffer]) for name in names],
+                                           names=names)
+        schema = _merge_schemas(self._pa, self._schema, table.schema)
+        path = os.path.join(self.path, f'part-{self._parts:05d}.parquet')
+        # written aside and renamed, so a part file is either complete or absent
+        self._pq.write_table(_cast(self._pa, table, schema), path + '.tmp')
+        os.replace(path + '.tmp', path)
+        self._parts += 1
+        self._schema = schema
+        self._buffer = []
+
+    def close(self):
+        self._flush()
+
+
+WRITERS = {'ndjson': NDJSONWriter, 'csv': CSVWriter, 'parquet': ParquetWriter}
+
+
+def open_writer(directory: str, name: str, fmt: str = 'ndjson'):
+    """
+    Open a writer for ``name`` inside ``directory``, appending to its output: ``name.ndjson``, ``name.csv`` or the
+    ``name.parquet`` dataset directory.
+
+    :param str directory: Output directory.
+    :param str name: Base name of the output file.
+    :param str fmt: Output format. Options: 'ndjson', 'csv', 'parquet'.
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f'Unknown format {fmt!r}. Options: {", ".join(WRITERS)}')
+    return WRITERS[fmt](os.path.join(directory, f'{name}.{WRITERS[fmt].extension}'))
+
+
+def read_parquet(path: str):
+    """
+    Read a dataset written by ``ParquetWriter`` into a single ``pyarrow.Table``, promoting the schemas of its part
+    files to a common one.
+    """
+    import pyarrow
+    import pyarrow.parquet
+    parts = [pyarrow.parquet.read_table(os.path.join(path, name)) for name in sorted(os.listdir(path))
+             if name.startswith('part-') and name.endswith('.parquet')]
+    schema = pyarrow.schema([])
+    for part in parts:
+        schema = _merge_schemas(pyarrow, schema, part.schema)
+    return pyarrow.concat_tables([_cast(pyarrow, part, schema) for part in parts]) if parts else schema.empty_table()
@@ -0,0 +1,50 @@
+import json
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append((self.path, dict(self.headers)))
+        status, body, delay = self.server.respond(self.path, self.headers)
+        if delay:
+            time.sleep(delay)
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass  # clients hanging up on slow responses (timeouts, hedging) are expected
+
+
+@pytest.fixture
+def server():
+    """
+    Local HTTP server recording every request. Set ``server.respond`` to a callable taking ``(path, headers)`` and
+    returning ``(status, body, delay)``; by default it echoes the path and the Authorization header.
+    """
+    httpd = _Server(('127.0.0.1', 0), _Handler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.respond = lambda path, headers: (200, {'data': {'path': path, 'auth': headers.get('Authorization')}}, 0)
+    httpd.url = f'http://127.0.0.1:{httpd.server_port}'
+    threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
@@ -0,0 +1,101 @@
+import copy
+import concurrent.futures
+
+import pytest
+
+from lunarcrush.lcv3 import LunarCrushV3
+from lunarcrush.archive import ResponseArchive, diff, patch
+
+_PAIRS = [
+    ({'a': 1, 'b': [1, 2]}, {'a': 2, 'b': [1, 2, 3], 'c': None}),
+    ({'a': {'b': {'c': 1}}, 'd': 1}, {'a': {'b': {'c': 2}}}),
+    ([{'id': 1, 'v': 1}, {'id': 2, 'v': 2}], [{'id': 2, 'v': 3}, {'id': 3, 'v': 0}, {'id': 1, 'v': 1}]),
+    ([1, 2, 3], [1]),
+    ([{'id': 1}, {'id': 1}], [{'id': 1, 'x': 1}]),
+    ({'a': [1]}, {'a': {'b': 1}}),
+    ('x', None),
+]
+
+
+@pytest.mark.parametrize('old, new', _PAIRS)
+def test_diff_patch_round_trip(old, new):
+    before = copy.deepcopy(old)
+    assert patch(old, diff(old, new)) == new
+    assert old == before
+
+
+def test_equal_values_have_no_diff():
+    rows = [{'id': 1, 'v': [1, 2]}, {'id': 2, 'v': {}}]
+    assert diff(rows, copy.deepcopy(rows)) is None
+
+
+def _coins(n, price):
+    return {'data': [{'id': i, 'symbol': f'C{i}', 'price': price + i} for i in range(n)]}
+
+
+def test_reconstructs_every_snapshot(tmp_path):
+    archive = ResponseArchive(str(tmp_path), keyframe_interval=3)
+    for t in range(8):
+        archive.add('/coins', {'sort': 'alt_rank'}, _coins(5, t // 2), timestamp=float(t))
+    for t in range(8):
+        assert archive.get('/coins', {'sort': 'alt_rank'}, at=t + 0.5) == _coins(5, t // 2)
+    assert archive.timestamps('/coins', {'sort': 'alt_rank'}) == [float(t) for t in range(8)]
+    with pytest.raises(KeyError):
+        archive.get('/coins', {'sort': 'alt_rank'}, at=-1)
+
+
+def test_resumes_existing_archive(tmp_path):
+    first = ResponseArchive(str(tmp_path), keyframe_interval=4)
+    for t in range(3):
+        first.add('/coins', {}, _coins(3, t), timestamp=float(t))
+    second = ResponseArchive(str(tmp_path), keyframe_interval=4)
+    for t in range(3, 6):
+        second.add('/coins', {}, _coins(3, t), timestamp=float(t))
+    assert [second.get('/coins', at=t) for t in range(6)] == [_coins(3, t) for t in range(6)]
+    assert len(second.streams()) == 1
+
+
+def test_rejects_out_of_order_snapshots(tmp_path):
+    archive = ResponseArchive(str(tmp_path))
+    archive.add('/coins', {}, _coins(1, 1), timestamp=10.0)
+    with pytest.raises(ValueError):
+        archive.add('/coins', {}, _coins(1, 2), timestamp=5.0)
+    assert archive.get('/coins', at=20.0) == _coins(1, 1)
+
+
+def test_streams_match_client_params(server, tmp_path):
+    server.respond = lambda path, headers: (200, _coins(2, 1), 0)
+    client = LunarCrushV3('key')
+    client._BASE_URL = server.url
+    archive = ResponseArchive(str(tmp_path))
+    client.add_sink(archive)
+    client.get_coins(limit=10)
+    assert archive.get('/coins', {'sort': 'alt_rank', 'desc': False, 'limit': 10}) == _coins(2, 1)
+    assert archive.get(*client.describe('get_coins', limit=10)) == _coins(2, 1)
+
+
+def test_concurrent_captures_stay_in_order(tmp_path):
+    archive = ResponseArchive(str(tmp_path))
+
+    def capture(i):
+        for j in range(20):
+            archive.add('/coins', {}, _coins(1, i * 100 + j))
+
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        list(pool.map(capture, range(8)))
+    timestamps = archive.timestamps('/coins')
+    assert len(timestamps) == 160 and timestamps == sorted(timestamps)
+    archive.add('/coins', {}, _coins(1, -1))
+    assert archive.get('/coins') == _coins(1, -1) and len(archive.timestamps('/coins')) == 161
+
+
+def test_failing_sink_does_not_fail_the_call(server):
+    server.respond = lambda path, headers: (200, _coins(1, 1), 0)
+    client = LunarCrushV3('key')
+    client._BASE_URL = server.url
+
+    def broken(endpoint, params, response):
+        raise OSError('disk full')
+
+    client.add_sink(broken)
+    assert client.get_coins() == _coins(1, 1)
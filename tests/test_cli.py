@@ -0,0 +1,59 @@
+import json
+import time
+
+import pytest
+
+from lunarcrush import deadline
+from lunarcrush.cli import main, export, parse_grid
+from lunarcrush.lcv3 import LunarCrushV3
+from lunarcrush.writers import NDJSONWriter
+
+
+def test_parse_grid():
+    assert parse_grid(['coin=BTC,ETH', 'limit=10', 'desc=true']) == [
+        {'coin': 'BTC', 'limit': 10, 'desc': True}, {'coin': 'ETH', 'limit': 10, 'desc': True}]
+
+
+def test_pooled_keys_with_v2_is_a_usage_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(['export', 'get_assets', '-p', 'symbol=BTC', '-o', str(tmp_path / 'out.ndjson'),
+              '--api-version', 'v2', '--api-key', 'a,b'])
+    assert exit_info.value.code == 2
+    assert 'only supported by LunarCrushV3' in capsys.readouterr().err
+
+
+def test_export_with_cache_and_write_failures(server, tmp_path):
+    client = LunarCrushV3('key')
+    client._BASE_URL = server.url
+    grid = parse_grid(['coin=BTC,ETH,SOL'])
+
+    class FlakyWriter(NDJSONWriter):
+        def write(self, rows):
+            if rows[0]['coin'] == 'ETH':
+                raise OSError('disk full')
+            super().write(rows)
+
+    writer = FlakyWriter(str(tmp_path / 'out.ndjson'))
+    stats = export(client, 'get_coin', grid, writer, rate=1000, cache_dir=str(tmp_path / 'cache'), fields=['path'])
+    writer.close()
+    assert stats == {'requests': 3, 'cached': 0, 'failed': 1, 'rows': 2}
+    with open(tmp_path / 'out.ndjson') as f:
+        assert sorted(json.loads(line)['path'] for line in f) == ['/coins/BTC', '/coins/SOL']
+
+    writer = NDJSONWriter(str(tmp_path / 'again.ndjson'))
+    stats = export(client, 'get_coin', grid, writer, rate=1000, cache_dir=str(tmp_path / 'cache'), fields=['path'])
+    writer.close()
+    assert stats == {'requests': 0, 'cached': 3, 'failed': 0, 'rows': 3}
+    assert len(server.requests) == 3
+
+
+def test_export_honours_caller_deadline(server, tmp_path):
+    server.respond = lambda path, headers: (200, {'data': {}}, 1.0)
+    client = LunarCrushV3('key')
+    client._BASE_URL = server.url
+    writer = NDJSONWriter(str(tmp_path / 'out.ndjson'))
+    start = time.monotonic()
+    with deadline(0.2):
+        stats = export(client, 'get_coin', parse_grid(['coin=BTC,ETH']), writer, rate=1000)
+    writer.close()
+    assert time.monotonic() - start < 0.9 and stats['failed'] == 2
@@ -0,0 +1,84 @@
+import os
+import json
+import time
+
+import pytest
+
+from lunarcrush.lcv3 import LunarCrushV3
+from lunarcrush.crawler import NFTCrawler
+from lunarcrush import deadline
+from lunarcrush.writers import ParquetWriter, read_parquet
+
+
+def _client(server):
+    client = LunarCrushV3('key')
+    client._BASE_URL = server.url
+    return client
+
+
+def test_failed_tasks_are_recorded_and_retried(server, tmp_path):
+    broken = {'/nft/2'}
+    server.respond = lambda path, headers: ((500, {'error': 'boom'}, 0) if path in broken
+                                            else (200, {'data': {'path': path}}, 0))
+    crawler = NFTCrawler(_client(server), str(tmp_path), rate=1000, tasks=('nft',))
+    stats = crawler.run([1, 2, 3])
+    assert (stats.done, stats.failed) == (2, 1)
+    assert stats.errors[0]['nft'] == 2 and stats.errors[0]['task'] == 'nft'
+    with open(tmp_path / 'failed.ndjson') as f:
+        assert [json.loads(line)['nft'] for line in f] == [2]
+
+    broken.clear()
+    stats = crawler.run([1, 2, 3])
+    assert (stats.skipped, stats.done, stats.failed) == (2, 1, 0)
+
+
+def test_parquet_parts_are_complete_and_promoted(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'rows.parquet')
+    writer = ParquetWriter(path, batch_size=2)
+    writer.write([{'a': 1, 'b': None}, {'a': 2, 'b': None}])
+    assert writer.buffered == 0
+    assert pq.read_table(os.path.join(path, 'part-00000.parquet')).num_rows == 2  # readable before close
+    writer.write([{'a': 1.5, 'b': 3}, {'a': 2, 'b': 4, 'c': 'new'}])
+    writer.write([{'a': 3, 'b': 'x'}])
+    writer.close()
+    assert sorted(os.listdir(path)) == ['part-00000.parquet', 'part-00001.parquet', 'part-00002.parquet']
+
+    writer = ParquetWriter(path)
+    writer.write([{'a': 4}])
+    writer.close()
+    table = read_parquet(path)
+    assert [str(field.type) for field in table.schema] == ['double', 'string', 'string']
+    assert table.column('a').to_pylist() == [1, 2, 1.5, 2, 3, 4]
+    assert table.column('b').to_pylist() == [None, None, '3', '4', 'x', None]
+    assert table.column('c').to_pylist() == [None, None, None, 'new', None, None]
+
+    ParquetWriter(path, append=False).close()
+    assert os.listdir(path) == []
+
+
+def test_deadline_bounds_crawl(server, tmp_path):
+    server.respond = lambda path, headers: (200, {'data': {}}, 1.0)
+    crawler = NFTCrawler(_client(server), str(tmp_path), rate=1000, tasks=('nft',))
+    start = time.monotonic()
+    with deadline(0.2):
+        stats = crawler.run([1, 2])
+    assert time.monotonic() - start < 0.9
+    assert stats.failed == 2 and all('DeadlineExceeded' in error['error'] for error in stats.errors)
+
+
+def test_every_writer_is_closed_when_one_fails(server, tmp_path, monkeypatch):
+    closed = []
+    original = ParquetWriter.close
+
+    def close(self):
+        closed.append(os.path.basename(self.path))
+        if 'tokens' in self.path:
+            raise OSError('disk full')
+        original(self)
+    monkeypatch.setattr(ParquetWriter, 'close', close)
+    pytest.importorskip('pyarrow')
+    crawler = NFTCrawler(_client(server), str(tmp_path), rate=1000, fmt='parquet')
+    with pytest.raises(OSError):
+        crawler.run([1])
+    assert len(closed) == 3
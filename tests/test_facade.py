@@ -0,0 +1,93 @@
+from lunarcrush.lcv2 import LunarCrush
+from lunarcrush.lcv3 import LunarCrushV3
+from lunarcrush.facade import BackendHealth, LunarCrushAuto
+
+
+def test_failing_backend_ranks_after_healthy_one():
+    failing, healthy = BackendHealth(), BackendHealth()
+    for _ in range(10):
+        failing.record(0.01, error=True)
+        healthy.record(0.3)
+    assert failing.tripped
+    assert healthy.score() < failing.score()
+
+
+def test_breaker_closes_after_cooldown():
+    health = BackendHealth(cooldown=0.0)
+    health.record(0.01, error=True)
+    assert not health.tripped
+    assert health.score() == 0.01 + health.error_rate * health.error_penalty
+
+
+def _clients(server):
+    v2, v3 = LunarCrush(), LunarCrushV3('key')
+    v2._BASE_URL, v3._BASE_URL = f'{server.url}/v2', f'{server.url}/v3'
+    return v2, v3
+
+
+def test_normalized_coin_and_fallback(server):
+    def respond(path, headers):
+        if path.startswith('/v2'):
+            return 503, {'error': 'down'}, 0
+        return 200, {'data': {'id': 1, 'symbol': 'BTC', 'name': 'Bitcoin', 'price': 2.0, 'volume_24h': 3.0,
+                              'extra': True}}, 0
+    server.respond = respond
+    v2, v3 = _clients(server)
+    with LunarCrushAuto(v2=v2, v3=v3, prefer=('v2', 'v3'), hedge_after=None) as lc:
+        for _ in range(3):
+            result = lc.get_coin('BTC')
+        assert result['source'] == 'v3'
+        assert result['data']['price'] == 2.0 and result['data']['volume_24h'] == 3.0
+        assert result['data']['market_cap'] is None and 'extra' not in result['data']
+        assert lc.health['v2'].tripped
+    v2_calls = [path for path, _ in server.requests if path.startswith('/v2')]
+    assert len(v2_calls) < 3
+
+
+def test_same_schema_from_both_backends(server):
+    def respond(path, headers):
+        if path.startswith('/v2'):
+            return 200, {'data': [{'symbol': 'BTC', 'close': 1.0, 'volume': 5.0}]}, 0
+        return 200, {'data': {'symbol': 'BTC', 'price': 1.0, 'volume_24h': 5.0}}, 0
+    server.respond = respond
+    v2, v3 = _clients(server)
+    with LunarCrushAuto(v2=v2) as only_v2, LunarCrushAuto(v2=v2, v3=v3, prefer=('v3',)) as only_v3:
+        assert only_v2.get_coin('BTC')['data'] == only_v3.get_coin('BTC')['data']
+
+
+def test_time_series_sizes_v2_data_points(server):
+    point = {'time': 1, 'open': 1.0, 'close': 2.0, 'volume_24h': 5.0}
+    server.respond = lambda path, headers: (
+        (200, {'data': [{'symbol': 'BTC', 'timeSeries': [point]}]}, 0) if path.startswith('/v2')
+        else (200, {'data': [point]}, 0))
+    v2, v3 = _clients(server)
+    with LunarCrushAuto(v2=v2) as only_v2, LunarCrushAuto(v2=v2, v3=v3, prefer=('v3',)) as only_v3:
+        assert only_v2.get_coin_time_series('BTC', '1w', 'hour')['data'][0]['volume'] == 5.0
+        assert only_v2.get_coin_time_series('BTC', '1y', 'day')['data'] == \
+            only_v3.get_coin_time_series('BTC', '1y', 'day')['data']
+        only_v2.get_coin_time_series('BTC', '1y', 'hour')
+    v2_paths = [path for path, _ in server.requests if path.startswith('/v2')]
+    assert 'data_points=168' in v2_paths[0] and 'interval=hour' in v2_paths[0]
+    assert 'data_points=365' in v2_paths[1] and 'data_points=720' in v2_paths[2]
+
+
+def test_lists_and_coin_of_the_day_are_normalized(server):
+    def respond(path, headers):
+        if 'coinoftheday' in path:
+            return 200, ({'data': {'id': 1, 'symbol': 'BTC', 'name': 'Bitcoin', 'extra': 1}} if path.startswith('/v2')
+                         else {'id': 1, 'symbol': 'BTC', 'name': 'Bitcoin'}), 0
+        if 'exchanges' in path:
+            row = {'id': 7, 'name': 'X', 'volume': 3.0} if path.startswith('/v2') else {'id': 7, 'name': 'X',
+                                                                                        '1d_volume': 3.0}
+            return 200, {'data': [row]}, 0
+        return 200, {'data': [{'id': 2, 'twitter_screen_name': 'a', 'followers': 10}]}, 0
+    server.respond = respond
+    v2, v3 = _clients(server)
+    with LunarCrushAuto(v2=v2) as only_v2, LunarCrushAuto(v2=v2, v3=v3, prefer=('v3',)) as only_v3:
+        for name, args in [('get_coin_of_the_day', ()), ('get_exchanges', (5,)), ('get_influencers', ('BTC',))]:
+            result_v2, result_v3 = getattr(only_v2, name)(*args), getattr(only_v3, name)(*args)
+            assert (result_v2['source'], result_v3['source']) == ('v2', 'v3')
+            assert result_v2['data'] == result_v3['data']
+        assert only_v3.get_coin_of_the_day()['data'] == {'id': 1, 'symbol': 'BTC', 'name': 'Bitcoin'}
+        assert only_v3.get_exchanges()['data'][0]['volume_24h'] == 3.0
+        assert only_v3.get_influencers('BTC')['data'][0]['screen_name'] == 'a'
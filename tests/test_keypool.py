@@ -0,0 +1,113 @@
+import time
+import collections
+
+import pytest
+
+from lunarcrush.lcv3 import LunarCrushV3
+from lunarcrush.keypool import KeyPool
+from lunarcrush.exceptions import NoKeyAvailable, DeadlineExceeded
+
+
+def _serial(pool, calls, status=200):
+    used = collections.Counter()
+    for _ in range(calls):
+        key = pool.acquire()
+        used[key.key] += 1
+        pool.release(key, status)
+    return used
+
+
+def test_serial_calls_rotate_over_keys():
+    assert _serial(KeyPool(['a', 'b', 'c']), 6) == {'a': 2, 'b': 2, 'c': 2}
+
+
+def test_serial_calls_follow_weights():
+    assert _serial(KeyPool(['a', 'b'], weights=[2, 1]), 30) == {'a': 20, 'b': 10}
+
+
+def test_concurrent_calls_go_to_least_loaded_key():
+    pool = KeyPool(['a', 'b'], weights=[1, 3])
+    held = [pool.acquire() for _ in range(4)]
+    assert collections.Counter(key.key for key in held) == {'a': 1, 'b': 3}
+
+
+def test_quota_window_waits():
+    pool = KeyPool(['a'], quotas=[2], window=0.2)
+    start = time.monotonic()
+    _serial(pool, 3)
+    assert time.monotonic() - start >= 0.15
+    pool.release(pool.acquire(), 200)
+    with pytest.raises(DeadlineExceeded):
+        pool.acquire(time.monotonic() + 0.05)
+
+
+def test_quota_quarantine_is_waited_out_and_doubles():
+    pool = KeyPool(['a'], quota_cooldown=0.05)
+    pool.release(pool.acquire(), 429)
+    pool.release(pool.acquire(), 429)
+    assert 0.05 < pool.utilization()[0]['quarantined_for'] <= 0.1
+    with pytest.raises(DeadlineExceeded):
+        pool.acquire(time.monotonic() + 0.02)
+    pool.release(pool.acquire(), 200)
+    pool.release(pool.acquire(), 429)
+    assert pool.utilization()[0]['quarantined_for'] <= 0.05
+
+
+def test_auth_quarantine_fails_fast():
+    pool = KeyPool(['a', 'b'])
+    pool.release(pool.acquire(), 401)
+    assert _serial(pool, 2) == {'b': 2}
+    pool.release(pool.acquire(), 403)
+    with pytest.raises(NoKeyAvailable):
+        pool.acquire()
+
+
+@pytest.mark.parametrize('kwargs', [{'quotas': [1, 1]}, {'weights': [1]}, {'weights': [1, 0, 1]}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        KeyPool(['a', 'b', 'c'], **kwargs)
+
+
+def _client(server, api_key, **kwargs):
+    client = LunarCrushV3(api_key, backoff=0.01, **kwargs)
+    client._BASE_URL = server.url
+    return client
+
+
+def test_client_skips_rejected_key_and_balances(server):
+    server.respond = lambda path, headers: ((401, {'error': 'bad key'}, 0) if headers['Authorization'] == 'Bearer bad'
+                                            else (200, {'data': {}}, 0))
+    client = _client(server, ['bad', 'good1', 'good2'])
+    for _ in range(6):
+        assert client.get_coin('BTC') == {'data': {}}
+    used = collections.Counter(headers['Authorization'] for _, headers in server.requests)
+    assert used == {'Bearer bad': 1, 'Bearer good1': 3, 'Bearer good2': 3}
+
+
+def test_single_key_pool_retries_transient_429(server):
+    server.respond = lambda path, headers: ((429, {'error': 'slow down'}, 0) if len(server.requests) == 1
+                                            else (200, {'data': {}}, 0))
+    client = _client(server, KeyPool(['k'], quota_cooldown=0.05), retries=2)
+    assert client.get_coin('BTC') == {'data': {}}
+    assert len(server.requests) == 2
+
+
+def test_try_acquire_does_not_wait():
+    pool = KeyPool(['a'], quotas=[1], window=0.2)
+    key, wait = pool.try_acquire()
+    assert key.key == 'a' and wait == 0.0
+    pool.release(key, 200)
+    key, wait = pool.try_acquire()
+    assert key is None and 0.1 < wait <= 0.2
+
+
+def test_hedged_request_is_counted_on_its_own_key(server):
+    server.respond = lambda path, headers: (200, {'data': {}}, 0.4 if len(server.requests) == 4 else 0)
+    pool = KeyPool(['a', 'b'])
+    client = _client(server, pool, hedge_percentile=50, hedge_min_samples=3)
+    for _ in range(4):
+        client.get_coin('BTC')
+    time.sleep(0.5)  # let the slow primary finish
+    used = collections.Counter(headers['Authorization'] for _, headers in server.requests)
+    assert sum(used.values()) == 5 and abs(used['Bearer a'] - used['Bearer b']) == 1
+    assert sum(usage['window_requests'] for usage in pool.utilization()) == 5
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from lunarcrush.lcv2 import LunarCrush
+from lunarcrush.lcv3 import LunarCrushV3
+from lunarcrush.archive import ResponseArchive
+from lunarcrush.exceptions import SchemaError
+from lunarcrush.projection import Maybe, loads, project
+
+_ROWS = [{'symbol': 'BTC', 'price': 1, 'extra': [1, 2]}, {'symbol': 'ETH', 'price': 2.5, 'market_cap': None}]
+
+
+def test_list_projection_fills_missing_fields():
+    assert project(_ROWS, ['symbol', 'market_cap']) == [{'symbol': 'BTC', 'market_cap': None},
+                                                        {'symbol': 'ETH', 'market_cap': None}]
+
+
+def test_typed_projection():
+    assert project(_ROWS[0], {'symbol': str, 'price': float}) == {'symbol': 'BTC', 'price': 1}
+    assert project(_ROWS, {'market_cap': Maybe(float)}) == [{'market_cap': None}, {'market_cap': None}]
+    with pytest.raises(SchemaError):
+        project(_ROWS, {'price': int})
+    with pytest.raises(SchemaError):
+        project(_ROWS, {'close': float})
+    with pytest.raises(SchemaError):
+        project({'flag': True}, {'flag': float})
+
+
+def test_tuple_types():
+    assert project(_ROWS, {'price': (int, float)}) == [{'price': 1}, {'price': 2.5}]
+    assert repr(Maybe((int, str))) == 'Maybe(int or str)'
+    with pytest.raises(SchemaError, match='int or str'):
+        project(_ROWS, {'extra': Maybe((int, str))})
+
+
+def test_loads_keeps_other_keys():
+    raw = json.dumps({'config': {'id': 1}, 'data': _ROWS}).encode()
+    assert loads(raw, ['symbol']) == {'config': {'id': 1}, 'data': [{'symbol': 'BTC'}, {'symbol': 'ETH'}]}
+    assert loads(raw, None)['data'] == _ROWS
+
+
+def test_projected_responses_are_archived_apart(server, tmp_path):
+    server.respond = lambda path, headers: (200, {'data': _ROWS}, 0)
+    client = LunarCrushV3('key')
+    client._BASE_URL = server.url
+    archive = ResponseArchive(str(tmp_path))
+    client.add_sink(archive)
+    client.get_coins(fields=['symbol'])
+    client.get_coins()
+    assert archive.get(*client.describe('get_coins')) == {'data': _ROWS}
+    assert archive.get(*client.describe('get_coins', fields=['symbol'])) == {'data': [{'symbol': 'BTC'},
+                                                                                       {'symbol': 'ETH'}]}
+    assert len(archive.streams()) == 2
+
+
+def test_v2_methods_take_fields(server):
+    server.respond = lambda path, headers: (200, {'data': {'symbol': 'BTC', 'name': 'Bitcoin'}}, 0)
+    client = LunarCrush()
+    client._BASE_URL = server.url
+    for method in ('get_exchange', 'get_coin_of_the_day', 'get_coin_of_the_day_info'):
+        args = ('binance',) if method == 'get_exchange' else ()
+        assert getattr(client, method)(*args, fields=['symbol']) == {'data': {'symbol': 'BTC'}}
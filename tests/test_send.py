@@ -0,0 +1,122 @@
+import time
+import asyncio
+
+import pytest
+import requests
+
+from lunarcrush.lcv3 import LunarCrushV3
+from lunarcrush.exceptions import DeadlineExceeded, LunarCrushError
+from lunarcrush import deadline, deadlines
+
+
+def _client(server, **kwargs):
+    client = LunarCrushV3('key', backoff=0.01, **kwargs)
+    client._BASE_URL = server.url
+    return client
+
+
+def _fail_first(n, status=503):
+    calls = []
+
+    def respond(path, headers):
+        calls.append(path)
+        if len(calls) <= n:
+            return status, {'error': 'unavailable'}, 0
+        return 200, {'data': {'path': path}}, 0
+    return respond
+
+
+def test_retries_transient_errors(server):
+    server.respond = _fail_first(2)
+    assert _client(server, retries=2).get_coin('BTC') == {'data': {'path': '/coins/BTC'}}
+    assert len(server.requests) == 3
+
+
+def test_returns_last_response_when_retries_run_out(server):
+    server.respond = _fail_first(5)
+    assert _client(server, retries=1).get_coin('BTC') == {'error': 'unavailable'}
+    assert len(server.requests) == 2
+
+
+def test_does_not_retry_client_errors(server):
+    server.respond = _fail_first(1, status=404)
+    _client(server, retries=3).get_coin('BTC')
+    assert len(server.requests) == 1
+
+
+def test_deadline_bounds_slow_request(server):
+    server.respond = lambda path, headers: (200, {'data': {}}, 1.0)
+    client = _client(server)
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        with deadline(0.2):
+            client.get_coin('BTC')
+    assert time.monotonic() - start < 0.8
+
+
+def test_concurrent_tasks_keep_their_own_deadline():
+    async def task(seconds):
+        with deadline(seconds):
+            await asyncio.sleep(0.05)  # the other task enters its own deadline meanwhile
+            return deadlines.remaining()
+
+    async def main():
+        return await asyncio.gather(task(1.0), task(10.0))
+
+    short, long = asyncio.run(main())
+    assert short < 1.0 < long and deadlines.current() is None
+
+
+def test_timeout_budget_covers_retries(server):
+    server.respond = _fail_first(100)
+    client = LunarCrushV3('key', timeout=0.3, retries=10, backoff=0.1)
+    client._BASE_URL = server.url
+    with pytest.raises(DeadlineExceeded):
+        client.get_coin('BTC')
+    assert len(server.requests) < 10
+
+
+def test_default_request_timeout(server):
+    server.respond = lambda path, headers: (200, {'data': {}}, 1.0)
+    with pytest.raises(requests.Timeout):
+        _client(server, request_timeout=0.2).get_coin('BTC')
+
+
+def test_hedges_slow_requests(server):
+    server.respond = lambda path, headers: (200, {'data': {}}, 0.6 if len(server.requests) == 4 else 0)
+    client = _client(server, hedge_percentile=50, hedge_min_samples=3)
+    for _ in range(3):
+        client.get_coin('BTC')
+    start = time.monotonic()
+    client.get_coin('BTC')
+    assert time.monotonic() - start < 0.5
+    assert len(server.requests) == 5
+
+
+def test_latency_windows_are_per_endpoint(server):
+    client = _client(server, hedge_percentile=50, hedge_min_samples=1)
+    client.get_coin_historical('BTC')
+    client.get_coin_historical('ETH')
+    assert client._hedge_delay('/coins/*/historical') is not None
+    assert client._hedge_delay('/coins/*') is None
+
+
+class _Helpers(LunarCrushV3):
+    def get_btc(self):
+        return self._coin_request('BTC')
+
+    def _coin_request(self, coin):
+        return self._request(f'/coins/{coin}')
+
+    def get_two(self):
+        self._request('/coins/BTC')
+        return self._request('/coins/ETH')
+
+
+def test_describe_follows_helpers_and_rejects_several_requests(server):
+    client = _Helpers('key')
+    client._BASE_URL = server.url
+    assert client.describe('get_btc') == ('/coins/BTC', {})
+    with pytest.raises(LunarCrushError):
+        client.describe('get_two')
+    assert not server.requests
@@ -0,0 +1,97 @@
+import os
+import sys
+import time
+import asyncio
+import subprocess
+
+import pytest
+
+from lunarcrush.lcv3 import LunarCrushV3
+from lunarcrush.keypool import KeyPool
+from lunarcrush.exceptions import LunarCrushError
+
+httpx = pytest.importorskip('httpx')
+pytest.importorskip('h2')
+
+from lunarcrush.transport import HTTP2Transport  # noqa: E402
+
+
+def _client(server, **kwargs):
+    client = LunarCrushV3('key', backoff=0.01, transport=HTTP2Transport(), **kwargs)
+    client._BASE_URL = server.url
+    return client
+
+
+def test_async_clients_are_closed_with_their_loop(server):
+    client = _client(server)
+    opened = []
+
+    async def call():
+        response = await client.acall('get_coin', 'BTC')
+        opened.append(client.transport._clients[asyncio.get_running_loop()][0])
+        return response
+
+    assert asyncio.run(call()) == asyncio.run(call()) == {'data': {'path': '/coins/BTC', 'auth': 'Bearer key'}}
+    assert client.get_coin('BTC')['data']['path'] == '/coins/BTC'
+    assert len(opened) == 2 and all(async_client.is_closed for async_client in opened)
+    assert client.transport.clients == 1
+    client.transport.close()
+    assert client.transport.clients == 0
+
+
+def test_aclose_closes_client_of_running_loop(server):
+    client = _client(server)
+
+    async def call():
+        await client.acall('get_coin', 'BTC')
+        async_client = client.transport._clients[asyncio.get_running_loop()][0]
+        await client.transport.aclose()
+        return async_client
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(call()).is_closed
+    finally:
+        loop.close()
+
+
+def test_async_path_retries(server):
+    server.respond = lambda path, headers: ((503, {}, 0) if len(server.requests) == 1 else (200, {'data': {}}, 0))
+    assert asyncio.run(_client(server, retries=1).acall('get_coin', 'BTC')) == {'data': {}}
+    assert len(server.requests) == 2
+
+
+def test_waiting_for_a_key_does_not_block_the_loop(server):
+    client = LunarCrushV3(KeyPool(['k'], quotas=[1], window=0.3), transport=HTTP2Transport())
+    client._BASE_URL = server.url
+    ticks = []
+
+    async def ticker():
+        while len(ticks) < 100:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        tick = asyncio.ensure_future(ticker())
+        await asyncio.gather(client.acall('get_coin', 'BTC'), client.acall('get_coin', 'ETH'))
+        tick.cancel()
+
+    asyncio.run(main())
+    assert len(server.requests) == 2 and len(ticks) >= 10
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.2
+
+
+def test_acall_rejects_methods_that_are_not_a_single_request(server):
+    client = _client(server)
+    with pytest.raises(LunarCrushError):
+        asyncio.run(client.acall('get_coin_id', 'BTC'))
+    with pytest.raises(LunarCrushError):
+        client.describe('get_coin_id', 'BTC')
+    assert client._coins_list is None and not server.requests
+
+
+def test_asyncio_is_not_imported_by_sync_clients():
+    code = 'import sys, lunarcrush; lunarcrush.LunarCrushV3("key"); print("asyncio" in sys.modules)'
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=root)
+    assert result.stdout.strip() == 'False'
@@ -0,0 +1,67 @@
+import pytest
+
+from lunarcrush.universe import UniverseIndex
+
+_RESPONSE = {'data': [
+    {'id': 3, 'symbol': 'ETH', 'name': 'Ethereum', 'market_cap_rank': 2},
+    {'id': 1, 'symbol': 'BTC', 'name': 'Bitcoin', 'market_cap_rank': 1},
+    {'id': 7, 'symbol': 'BTC', 'name': 'Bitcoin Clone', 'market_cap_rank': 900},
+    {'id': 9, 'symbol': 'ÉTOILE', 'name': 'Étoile', 'market_cap_rank': None},
+    {'id': None, 'symbol': 'NOPE', 'name': 'No id'},
+]}
+
+
+@pytest.fixture
+def index():
+    return UniverseIndex.from_response(_RESPONSE, rank_key='market_cap_rank')
+
+
+def test_lookups(index):
+    assert len(index) == 4 and 7 in index and 2 not in index
+    assert index.get(3) == {'id': 3, 'symbol': 'ETH', 'name': 'Ethereum'}
+    assert [entry['id'] for entry in index.by_symbol('btc')] == [1, 7]
+    assert index.by_name('BITCOIN CLONE')[0]['id'] == 7
+    assert index.resolve('BTC') == 1 and index.resolve('7') == 7 and index.resolve('ethereum') == 3
+    with pytest.raises(KeyError):
+        index.resolve('DOGE')
+
+
+def test_search(index):
+    assert [entry['id'] for entry in index.search('b')] == [1, 7]
+    assert [entry['id'] for entry in index.search('bitcoin c')] == [7]
+    assert index.search('b', limit=1) == [index.get(1)]
+
+
+def test_dumps_loads_round_trip(index, tmp_path):
+    path = str(tmp_path / 'coins.lcux')
+    index.save(path)
+    loaded = UniverseIndex.load(path)
+    assert list(loaded.ids) == list(index.ids) and loaded.symbols == index.symbols and loaded.names == index.names
+    assert list(loaded.ranks) == list(index.ranks)
+    for query in ('btc', 'étoile', 'eth'):
+        assert loaded.by_symbol(query) == index.by_symbol(query)
+    assert loaded.search('b') == index.search('b')
+
+
+def test_empty_index_round_trip():
+    empty = UniverseIndex.loads(UniverseIndex([], [], []).dumps())
+    assert len(empty) == 0 and empty.search('a') == []
+
+
+def test_loads_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        UniverseIndex.loads(b'XXXX' + bytes(16))
+
+
+def test_client_ids_resolve_collisions_by_rank():
+    from lunarcrush.lcv3 import LunarCrushV3
+    client = LunarCrushV3('key')
+    # Bitcoin Clone (7) is ranked while Bitcoin (2) is not, so the clone wins despite its higher id
+    client._coins_list = {'data': [{'id': 7, 'symbol': 'BTC', 'name': 'Bitcoin Clone', 'market_cap_rank': 5},
+                                   {'id': 2, 'symbol': 'BTC', 'name': 'Bitcoin'},
+                                   {'id': 3, 'symbol': 'ETH', 'name': 'Ethereum', 'market_cap_rank': 2}]}
+    client._nfts_list = {'data': [{'id': 4, 'name': 'Punks', 'alt_rank': 3}, {'id': 2, 'name': 'Punks', 'alt_rank': 1}]}
+    assert client.get_coin_id('BTC') == '7' and client.coin_ids['BTC'] == 7
+    assert client.get_coin_id('DOGE') == 'None' and client.get_coin_id('Ethereum') == '3'
+    assert client.get_nft_id('Punks') == '2' and client.nft_ids['Punks'] == 2
+    assert client.get_nft_id('4') == '4' and client.get_nft_id('Apes') == 'None'